@@ -1,59 +1,100 @@
 
 from __future__ import annotations
 
+import logging
+from array import array
+from dataclasses import dataclass, field
 from typing import Dict, Iterable, List, Set, Tuple
 from collections import defaultdict
+from itertools import chain
+from sys import intern
+
+import numpy as np
 
 from .mapping_data import AlignmentResult, Node
 from .tagger import (
-    tag_record,
-    derive_type,
     alias_target_scope,
+    apply_type_rule,
+    namespace_info,
     normalize_feature_scope,
     relation_target_scope,
-    REL_NS_TO_PREDICATE,
+    TAG_ALIAS,
+    TAG_RELATION,
 )
 from .union_find import UnionFind
 from omics_io.omics_io.parse_obj import OmicData
 
+logger = logging.getLogger(__name__)
+
 # ---------------- Types ----------------
 ScopedID = Tuple[str, str]
-AliasKey = Tuple[ScopedID, ScopedID]
-RelTriple = Tuple[ScopedID, str, ScopedID]
+UnknownTriple = Tuple[ScopedID, str, ScopedID]
 
 
-# ---------------- Small helpers ----------------
-def key(scope: str, ident: str) -> ScopedID:
-    return (str(scope), str(ident).strip())
+@dataclass
+class AliasEdges:
+    """Alias edges as parallel int arrays of interned key indices.
+
+    Duplicates are kept: re-uniting an already merged pair is a no-op, so
+    the union kernel consumes the arrays as-is.
+    """
+
+    src: array = field(default_factory=lambda: array("i"))
+    dst: array = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+
+@dataclass
+class RelEdges:
+    """Relation edges as parallel int arrays (struct of arrays).
 
+    Edge ``i`` is ``src[i] --predicates[pred[i]]--> tgt[i]`` where src/tgt
+    are interned key indices and ``predicates`` maps predicate → code.
+    """
 
-def alias_ok(a, b, id_type, inferred):
-    ta = id_type.get(a) or inferred.get(a)
-    tb = id_type.get(b) or inferred.get(b)
-    
-    if ta is None and tb is None:
-        return False
-    return ta is None or tb is None or ta == tb
+    src: array = field(default_factory=lambda: array("i"))
+    pred: array = field(default_factory=lambda: array("i"))
+    tgt: array = field(default_factory=lambda: array("i"))
+    predicates: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.src)
+
+
+# ---------------- Small helpers ----------------
+def alias_ok(ta: np.ndarray, tb: np.ndarray) -> np.ndarray:
+    """Mask of alias pairs allowed to merge, given per-side type codes.
+
+    A code of -1 means untyped. Pairs merge when at least one side is typed
+    and the types agree whenever both are.
+    """
+    known_a, known_b = ta >= 0, tb >= 0
+    return (known_a | known_b) & (~known_a | ~known_b | (ta == tb))
 
 
 # ---------------- Stage 1: feature meta ----------------
 def collect_feature_scopes_and_types(
     datasets: Iterable[OmicData],
-) -> Tuple[Dict[Tuple[str, str], str], Dict[ScopedID, str]]:
-    feat_scope: Dict[Tuple[str, str], str] = {}
+) -> Tuple[Dict[str, Dict[str, str]], Dict[ScopedID, str]]:
+    """Feature scopes per dataset name (``od.name -> fid -> scope``) and the
+    explicit entity type of every typed scoped ID."""
+    feat_scope: Dict[str, Dict[str, str]] = {}
     id_type: Dict[ScopedID, str] = {}
     for od in datasets:
-        for f in od.feature_meta:
-            scope = normalize_feature_scope(od, f.namespace)
-            feat_scope[(od.name, f.id)] = scope
-            if f.entity:
-                id_type[key(scope, f.id)] = f.entity
-
-        for f in od.column_meta:
-            scope = normalize_feature_scope(od, f.namespace)
-            feat_scope[(od.name, f.id)] = scope
+        ds_scope = feat_scope.setdefault(od.name, {})
+        scope_by_ns: Dict[str | None, str] = {}
+        for f in chain(od.feature_meta, od.column_meta):
+            scope = scope_by_ns.get(f.namespace)
+            if scope is None:
+                scope = scope_by_ns[f.namespace] = normalize_feature_scope(
+                    od, f.namespace
+                )
+            fid = f.id
+            ds_scope[fid] = scope
             if f.entity:
-                id_type[key(scope, f.id)] = f.entity
+                id_type[(scope, intern(fid.strip()))] = f.entity
 
     return feat_scope, id_type
 
@@ -61,29 +102,71 @@ def collect_feature_scopes_and_types(
 # ---------------- Stage 2: cross-ref ingest ----------------
 def ingest_cross_refs(
     datasets: Iterable[OmicData],
-    feat_scope: Dict[Tuple[str, str], str],
+    feat_scope: Dict[str, Dict[str, str]],
     id_type: Dict[ScopedID, str],
-) -> Tuple[Set[AliasKey], List[RelTriple], List[RelTriple], Dict[ScopedID, str]]:
-    alias_edges: Set[AliasKey] = set()
-    rel_edges: List[RelTriple] = []
-    unknown_edges: List[RelTriple] = []
+) -> Tuple[
+    AliasEdges,
+    RelEdges,
+    List[UnknownTriple],
+    Dict[ScopedID, str],
+    Dict[ScopedID, int],
+]:
+    """Classify cross-refs into alias/relation/unknown edges.
+
+    Every key that appears on an alias or relation edge is interned to a
+    dense integer index (``key_to_idx``, insertion-ordered so that
+    ``list(key_to_idx)`` is the index → key table); the returned edges
+    refer to keys by that index. Relation edges are appended straight into
+    ``RelEdges`` arrays, with predicates interned to int codes.
+    """
+    alias_edges = AliasEdges()
+    alias_src_append = alias_edges.src.append
+    alias_dst_append = alias_edges.dst.append
+    rel_edges = RelEdges()
+    predicate_ids = rel_edges.predicates
+    src_append = rel_edges.src.append
+    pred_append = rel_edges.pred.append
+    tgt_append = rel_edges.tgt.append
+    unknown_edges: List[UnknownTriple] = []
     inferred_type: Dict[ScopedID, str] = {}
+    key_to_idx: Dict[ScopedID, int] = {}
+    # scope helpers are pure and see few distinct argument combinations
+    ns_cache: Dict[str, tuple] = {}
+    alias_scope_cache: Dict[Tuple[str, str, str], str] = {}
+    rel_scope_cache: Dict[Tuple[str, str], str] = {}
 
     for od in datasets:
         ds_default_scope = normalize_feature_scope(od, None)
+        ds_scope = feat_scope.get(od.name, {})
         for cr in od.cross_ref:
             src_raw = str(cr.src).strip()
             tgt_raw = str(cr.target).strip()
-            rel_ns = str(cr.namespace).lower().strip()
-            tag = tag_record(rel_ns)
-
-            s_src = feat_scope.get((od.name, src_raw), ds_default_scope)
-
-            if tag == "alias":
-                s_tgt_fb = feat_scope.get((od.name, tgt_raw), ds_default_scope)
-                s_tgt = alias_target_scope(rel_ns, s_src, s_tgt_fb)
-
-                k_src, k_tgt = key(s_src, src_raw), key(s_tgt, tgt_raw)
+            ns_info = ns_cache.get(cr.namespace)
+            if ns_info is None:
+                rel_ns = str(cr.namespace).lower().strip()
+                tag, predicate, rel_scope, type_rule = namespace_info(rel_ns)
+                pred_code = (
+                    predicate_ids.setdefault(predicate, len(predicate_ids))
+                    if tag == TAG_RELATION
+                    else -1
+                )
+                ns_info = ns_cache[cr.namespace] = (
+                    rel_ns, tag, pred_code, rel_scope, type_rule
+                )
+            rel_ns, tag, pred_code, rel_scope, type_rule = ns_info
+
+            s_src = ds_scope.get(src_raw, ds_default_scope)
+
+            if tag == TAG_ALIAS:
+                s_tgt_fb = ds_scope.get(tgt_raw, ds_default_scope)
+                scope_args = (rel_ns, s_src, s_tgt_fb)
+                s_tgt = alias_scope_cache.get(scope_args)
+                if s_tgt is None:
+                    s_tgt = alias_scope_cache[scope_args] = alias_target_scope(
+                        *scope_args
+                    )
+
+                k_src, k_tgt = (s_src, src_raw), (s_tgt, tgt_raw)
 
                 # propagate explicit types across alias
                 ts, tt = id_type.get(k_src), id_type.get(k_tgt)
@@ -92,127 +175,168 @@ def ingest_cross_refs(
                 if tt and k_src not in id_type:
                     inferred_type[k_src] = tt
 
-                a, b = sorted((k_src, k_tgt))
-                alias_edges.add((a, b))
+                alias_src_append(key_to_idx.setdefault(k_src, len(key_to_idx)))
+                alias_dst_append(key_to_idx.setdefault(k_tgt, len(key_to_idx)))
                 continue
 
             # relation or unknown
-            s_tgt_fb = feat_scope.get((od.name, tgt_raw), ds_default_scope)
-            s_tgt = relation_target_scope(rel_ns, s_tgt_fb)
-            k_src, k_tgt = key(s_src, src_raw), key(s_tgt, tgt_raw)
-
-            if tag == "relation":
-                predicate = REL_NS_TO_PREDICATE.get(rel_ns, rel_ns)
+            s_tgt_fb = ds_scope.get(tgt_raw, ds_default_scope)
+            if rel_scope is not None:
+                s_tgt = rel_scope
+            else:
+                scope_args = (rel_ns, s_tgt_fb)
+                s_tgt = rel_scope_cache.get(scope_args)
+                if s_tgt is None:
+                    s_tgt = rel_scope_cache[scope_args] = relation_target_scope(
+                        *scope_args
+                    )
+            k_src, k_tgt = (s_src, src_raw), (s_tgt, tgt_raw)
+
+            if tag == TAG_RELATION:
                 src_t = id_type.get(k_src, "unknown")
-                tgt_t = derive_type(rel_ns, src_t)
+                tgt_t = apply_type_rule(type_rule, src_t)
                 if k_tgt not in id_type and tgt_t != "unknown":
                     inferred_type[k_tgt] = tgt_t
-                rel_edges.append((k_src, predicate, k_tgt))
+                i_src = key_to_idx.setdefault(k_src, len(key_to_idx))
+                i_tgt = key_to_idx.setdefault(k_tgt, len(key_to_idx))
+                src_append(i_src)
+                pred_append(pred_code)
+                tgt_append(i_tgt)
             else:
-                print(f'Unknown Edge: {k_src,rel_ns,k_tgt}')
+                logger.debug("Unknown Edge: %s %s %s", k_src, rel_ns, k_tgt)
                 unknown_edges.append((k_src, rel_ns, k_tgt))
 
-    return alias_edges, rel_edges, unknown_edges, inferred_type
+    return alias_edges, rel_edges, unknown_edges, inferred_type, key_to_idx
 
 
-# ---------------- Stage 3: union-find build ----------------
-def build_union_find(
-    alias_edges: Set[AliasKey],
-    rel_edges: List[RelTriple],
+def type_codes(
+    keys: List[ScopedID],
     id_type: Dict[ScopedID, str],
     inferred_type: Dict[ScopedID, str],
-) -> Tuple[UnionFind, Set[ScopedID]]:
-    uf = UnionFind()
-    all_keys: Set[ScopedID] = set()
+) -> Tuple[np.ndarray, List[str]]:
+    """Intern each key's (explicit or inferred) type to a small int.
+
+    Returns the per-key codes (-1 where untyped) and the code → type table.
+    Computed once per alignment and shared by the union and resolve stages.
+    """
+    # explicit types win over inferred ones: one probe per key
+    types = {**inferred_type, **id_type}
+    type_ids: Dict[str, int] = {}
+    codes = np.fromiter(
+        (
+            type_ids.setdefault(t, len(type_ids)) if t else -1
+            for t in map(types.get, keys)
+        ),
+        dtype=np.int32,
+        count=len(keys),
+    )
+    return codes, list(type_ids)
 
-    def touch(k: ScopedID) -> None:
-        all_keys.add(k)
-        uf.find(k)
 
-    for a, b in alias_edges:
-        touch(a)
-        touch(b)
-        if alias_ok(a, b, id_type, inferred_type):
-            uf.union(a, b)
-    for a, _, b in rel_edges:
-        touch(a)
-        touch(b)
+# ---------------- Stage 3: union-find build ----------------
+def build_union_find(
+    alias_edges: AliasEdges,
+    type_code: np.ndarray,
+) -> UnionFind:
+    uf = UnionFind(len(type_code))
+    if not len(alias_edges):
+        return uf
 
-    return uf, all_keys
+    # zero-copy views over the ingest buffers, fed to the compiled kernel
+    src = np.frombuffer(alias_edges.src, dtype=np.int32)
+    dst = np.frombuffer(alias_edges.dst, dtype=np.int32)
+    ok = alias_ok(type_code[src], type_code[dst])
+    uf.union_many(src[ok], dst[ok])
+    return uf
 
 
 # ---------------- Stage 4: resolve types ----------------
 def resolve_component_types(
-    uf: UnionFind,
-    all_keys: Set[ScopedID],
-    id_type: Dict[ScopedID, str],
-    inferred_type: Dict[ScopedID, str],
-) -> Dict[ScopedID, str]:
-    root_to_members: Dict[ScopedID, List[ScopedID]] = defaultdict(list)
-    for ksid in all_keys:
-        root_to_members[uf.find(ksid)].append(ksid)
-
-    final_type: Dict[ScopedID, str] = {}
-    for _, members in root_to_members.items():
-        known = {id_type.get(m) or inferred_type.get(m) for m in members}
-        known.discard(None)
-        ty = next(iter(known)) if len(known) == 1 else "unknown"
-        for m in members:
-            final_type[m] = ty
-    return final_type
+    roots: np.ndarray,
+    codes: np.ndarray,
+    names: List[str],
+) -> List[str]:
+    n = len(codes)
+    if n == 0:
+        return []
+
+    # a component keeps a type only if all of its typed members agree on it:
+    # per root, the min and max typed code coincide (untyped roots never do)
+    typed = codes >= 0
+    lo = np.full(n, np.iinfo(np.int32).max, dtype=np.int32)
+    hi = np.full(n, -1, dtype=np.int32)
+    np.minimum.at(lo, roots[typed], codes[typed])
+    np.maximum.at(hi, roots[typed], codes[typed])
+    root_code = np.where(lo == hi, lo, -1)
+
+    # code -1 indexes the trailing "unknown"
+    names = [*names, "unknown"]
+    return [names[c] for c in root_code[roots].tolist()]
 
 
 # ---------------- Stage 5: materialize ----------------
 def materialize_alignment(
-    uf: UnionFind,
-    all_keys: Set[ScopedID],
-    final_type: Dict[ScopedID, str],
-    rel_edges: List[RelTriple],
+    roots: np.ndarray,
+    keys: List[ScopedID],
+    final_type: List[str],
+    rel_edges: RelEdges,
     unknown_edges,
 ) -> AlignmentResult:
-    roots: Dict[ScopedID, int] = {}
-    next_gid = 0
-
-    def gid_for(k: ScopedID) -> int:
-        nonlocal next_gid
-        r = uf.find(k)
-        if r not in roots:
-            roots[r] = next_gid
-            next_gid += 1
-        return roots[r]
+    # gids are numbered by first appearance of each root
+    root_gid: Dict[int, int] = {}
+    key_gid: List[int] = [
+        root_gid.setdefault(r, len(root_gid)) for r in roots.tolist()
+    ]
 
     node_to_gid: Dict[Node, int] = {}
     groups: Dict[int, Set[Node]] = defaultdict(set)
 
-    for ksid in all_keys:
-        ns, ident = ksid
+    # namespaces and types repeat across nodes; share one string object each
+    for idx, (ns, ident) in enumerate(keys):
         n = Node(
             identifier=str(ident),
-            namespace=str(ns),
-            type=final_type.get(ksid, "unknown"),
+            namespace=intern(str(ns)),
+            type=intern(final_type[idx]),
         )
-        gid = gid_for(ksid)
+        gid = key_gid[idx]
         node_to_gid[n] = gid
         groups[gid].add(n)
 
-    group_relations: Dict[Tuple[int, str, int], int] = defaultdict(int)
-    for a, predicate, b in rel_edges:
-        ga, gb = gid_for(a), gid_for(b)
-        group_relations[(ga, predicate, gb)] += 1
-    
+    # lift edges to group triples and count duplicates in one vectorized pass
+    group_relations: Dict[Tuple[int, str, int], int] = {}
+    if len(rel_edges):
+        gid_arr = np.asarray(key_gid, dtype=np.int64)
+        triples = np.stack(
+            (
+                gid_arr[np.frombuffer(rel_edges.src, dtype=np.int32)],
+                np.frombuffer(rel_edges.pred, dtype=np.int32),
+                gid_arr[np.frombuffer(rel_edges.tgt, dtype=np.int32)],
+            ),
+            axis=1,
+        )
+        uniq, counts = np.unique(triples, axis=0, return_counts=True)
+        predicates = list(rel_edges.predicates)
+        group_relations = {
+            (ga, predicates[p], gb): c
+            for (ga, p, gb), c in zip(uniq.tolist(), counts.tolist())
+        }
+
     return AlignmentResult(
         node_to_gid=node_to_gid,
         groups=dict(groups),
-        group_relations=dict(group_relations),
+        group_relations=group_relations,
         unknown_edges=unknown_edges,
     )
 
 
 def match_references(*omic_data_sets: OmicData) -> AlignmentResult:
     feat_scope, id_type = collect_feature_scopes_and_types(omic_data_sets)
-    alias_edges, rel_edges, unknown_edges, inferred_type = ingest_cross_refs(
-        omic_data_sets, feat_scope, id_type
+    alias_edges, rel_edges, unknown_edges, inferred_type, key_to_idx = (
+        ingest_cross_refs(omic_data_sets, feat_scope, id_type)
     )
-    uf, all_keys = build_union_find(alias_edges, rel_edges, id_type, inferred_type)
-    final_type = resolve_component_types(uf, all_keys, id_type, inferred_type)
-    return materialize_alignment(uf, all_keys, final_type, rel_edges, unknown_edges)
+    keys = list(key_to_idx)
+    codes, type_names = type_codes(keys, id_type, inferred_type)
+    uf = build_union_find(alias_edges, codes)
+    roots = uf.roots()
+    final_type = resolve_component_types(roots, codes, type_names)
+    return materialize_alignment(roots, keys, final_type, rel_edges, unknown_edges)
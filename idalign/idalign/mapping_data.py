@@ -1,12 +1,14 @@
 from dataclasses import dataclass, field
 from typing import Dict, Set, Tuple, List, Optional, Iterator
+from collections import defaultdict
+from functools import cached_property
 import pandas as pd
 import os
 import json
 import datetime as dt
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Node:
     identifier: str
     type: str 
@@ -32,7 +34,32 @@ class AlignmentResult:
     groups: Dict[int, dict]                        
     group_relations: Dict[Tuple[int, str, int], int]
     unknown_edges: List[Tuple[Node, str, Node]] = None
-    
+    # Lazily built adjacency caches; group_relations is not mutated after
+    # construction so these stay valid for the lifetime of the result.
+    _out_index: Optional[Dict[int, List[Tuple[str, int, int]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _in_index: Optional[Dict[int, List[Tuple[str, int, int]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _build_relation_index(self) -> None:
+        out_index: Dict[int, List[Tuple[str, int, int]]] = defaultdict(list)
+        in_index: Dict[int, List[Tuple[str, int, int]]] = defaultdict(list)
+        for (g1, rel, g2), cnt in self.group_relations.items():
+            out_index[g1].append((rel, g2, cnt))
+            in_index[g2].append((rel, g1, cnt))
+        self._out_index = dict(out_index)
+        self._in_index = dict(in_index)
+
+    @cached_property
+    def _linked_gids(self) -> Set[int]:
+        linked: Set[int] = set()
+        for g1, _, g2 in self.group_relations:
+            linked.add(g1)
+            linked.add(g2)
+        return linked
+
     def gid_of(self, namespace: str, ident: str) -> Optional[int]:
         """Return the group ID containing the given identifier, if present.
 
@@ -65,11 +92,9 @@ class AlignmentResult:
         Returns:
             list[tuple[str, int, int]]: Triplets of (relation_label, target_gid, count).
         """
-        return [
-            (rel, g2, cnt)
-            for (g1, rel, g2), cnt in self.group_relations.items()
-            if g1 == gid
-        ]
+        if self._out_index is None:
+            self._build_relation_index()
+        return list(self._out_index.get(gid, ()))
 
     def relations_to(self, gid: int) -> List[Tuple[str, int, int]]:
         """Return all incoming relations targeting a group.
@@ -80,11 +105,9 @@ class AlignmentResult:
         Returns:
             list[tuple[str, int, int]]: Triplets of (relation_label, source_gid, count).
         """
-        return [
-            (rel, g1, cnt)
-            for (g1, rel, g2), cnt in self.group_relations.items()
-            if g2 == gid
-        ]
+        if self._in_index is None:
+            self._build_relation_index()
+        return list(self._in_index.get(gid, ()))
 
     def structural_orphans(self) -> Set[int]:
         """Return group IDs with no incoming or outgoing relations.
@@ -92,10 +115,7 @@ class AlignmentResult:
         These are groups that are completely disconnected at the relation level,
         even if they contain multiple aliases internally.
         """
-        linked = {g1 for (g1, _, _) in self.group_relations} | {
-            g2 for (_, _, g2) in self.group_relations
-        }
-        return set(self.groups.keys()) - linked
+        return set(self.groups.keys()) - self._linked_gids
 
     def isolated_groups(self) -> Set[int]:
         """Return group IDs containing only a single node.
@@ -106,10 +126,7 @@ class AlignmentResult:
 
     def connected_groups(self) -> Set[int]:
         """Return group IDs that participate in at least one relation."""
-        linked = {g1 for (g1, _, _) in self.group_relations} | {
-            g2 for (_, _, g2) in self.group_relations
-        }
-        return linked
+        return set(self._linked_gids)
 
     def to_frames(self):
         """Convert alias and relation data into DataFrame representations.
@@ -119,16 +136,28 @@ class AlignmentResult:
                 - alias_df: with columns [gid, namespace, ident]
                 - rel_df: with columns [gid_src, relation, gid_tgt, count]
         """
-        alias_rows = [
-            {"gid": g, "namespace": n.namespace, "ident": n.ident}
-            for g, nodes in self.groups.items()
-            for n in nodes
-        ]
-        rel_rows = [
-            {"gid_src": a, "relation": r, "gid_tgt": b, "count": c}
-            for (a, r, b), c in self.group_relations.items()
-        ]
-        return pd.DataFrame(alias_rows), pd.DataFrame(rel_rows)
+        gids, namespaces, idents = [], [], []
+        for g, nodes in self.groups.items():
+            for n in nodes:
+                gids.append(g)
+                namespaces.append(n.namespace)
+                idents.append(n.identifier)
+        alias_df = pd.DataFrame(
+            {"gid": gids, "namespace": namespaces, "ident": idents}
+        )
+
+        srcs, rels, tgts = (
+            zip(*self.group_relations) if self.group_relations else ((), (), ())
+        )
+        rel_df = pd.DataFrame(
+            {
+                "gid_src": list(srcs),
+                "relation": list(rels),
+                "gid_tgt": list(tgts),
+                "count": list(self.group_relations.values()),
+            }
+        )
+        return alias_df, rel_df
 
     @classmethod
     def from_frames(cls, alias_df, rel_df):
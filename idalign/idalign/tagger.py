@@ -1,6 +1,8 @@
+from types import MappingProxyType
+
 from omics_io.omics_io.identifiers import IDS
 
-TYPE_MAP = {
+TYPE_MAP = MappingProxyType({
     # Aliases (unique IDs / synonyms per entity)
     "asap": "alias",
     "ecocyc": "alias",
@@ -29,37 +31,10 @@ TYPE_MAP = {
     "uniprotkb/swiss-prot": "relation",
     "parent": "relation",
     "genbank": "relation",
-}
-TYPE_MAP = {
-    "asap": "alias",
-    "ecocyc": "alias",
-    "geneid": "alias",
-    "id": "alias",
-    "kegg.compound": "alias",
-    "name": "alias",
-    "refmet": "alias",
-    "workbench": "alias",
-    "alias": "alias",
-    "gene": "alias",
-    "locus_tag": "alias",
-    "run": "alias",
-    "srx": "alias", 
-    "geo": "relation",
-    "genotype": "relation",
-    IDS.predicates.modification: "relation",
-    IDS.predicates.produced_by: "relation",
-    IDS.predicates.contains: "relation",
-    IDS.predicates.has_feature: "relation",
-    IDS.predicates.product: "relation",
-    "product_label": "relation",
-    "protein_id": "relation",
-    "uniprotkb/swiss-prot": "relation",
-    "parent": "relation",
-    "genbank": "relation",
-}
+})
 
 
-_REL_TYPE_MAP = {
+_REL_TYPE_MAP = MappingProxyType({
     "protein_id": IDS.type.protein,
     "uniprotkb/swiss-prot": IDS.type.protein,
     "kegg.compound": IDS.type.metabolite,
@@ -70,18 +45,18 @@ _REL_TYPE_MAP = {
     "product_label": IDS.type.protein,
     "product": IDS.type.protein,
     "geo" : IDS.type.study
-}
+})
 
-REGISTRY_NS = {
+REGISTRY_NS = frozenset({
     "geneid","uniprot","uniprotkb","ensembl","refseq","ecocyc","asap",
     "chebi","kegg","hmdb","pubchem","genbank_reference","refseq.locus_tag","kegg.compound",
-}
-LOCAL_NS = {
+})
+LOCAL_NS = frozenset({
     "gene","gene_name","gene_symbol","symbol","synonym","gene_synonym",
     "locus_tag","name","id","workbench",
-}
+})
 
-REL_NS_TO_REGISTRY = {
+REL_NS_TO_REGISTRY = MappingProxyType({
     "uniprotkb/swiss-prot": "uniprot",
     "protein_id": "protein",
     "genbank": "dna",
@@ -90,9 +65,9 @@ REL_NS_TO_REGISTRY = {
     "modification": "metabolite",
     "produced_by": "protein",
     "product_label": "protein",
-}
+})
 
-REL_NS_TO_PREDICATE = {
+REL_NS_TO_PREDICATE = MappingProxyType({
     "uniprotkb/swiss-prot": "product",
     "protein_id": "product",
     "produced_by": "produced_by",
@@ -101,48 +76,87 @@ REL_NS_TO_PREDICATE = {
     "contains": "contains",
     "genbank": "contains",
     "modification": "modification",
-}
+})
 
-def tag_record(namespace):
-    if namespace.lower() not in TYPE_MAP:
-        return "unclassified"
-    return TYPE_MAP[namespace.lower()]
+# Single-probe scope classification for feature/alias namespaces.
+_REGISTRY = "registry"
+_LOCAL = "local"
+SCOPE_KIND = MappingProxyType({
+    **dict.fromkeys(LOCAL_NS, _LOCAL),
+    **dict.fromkeys(REGISTRY_NS, _REGISTRY),
+})
+# Relation target scope: explicit remaps win over registry pass-through.
+_REL_TARGET_SCOPE = MappingProxyType(
+    {**{ns: ns for ns in REGISTRY_NS}, **REL_NS_TO_REGISTRY}
+)
 
-def derive_type(namespace: str, source_type: str) -> str:
-    rule = _REL_TYPE_MAP.get(namespace.lower())
+# Cross-ref namespace dispatch: one probe yields everything ingest needs,
+# (tag, predicate, relation target scope or None, target type rule or None).
+TAG_ALIAS, TAG_RELATION, TAG_UNCLASSIFIED = 0, 1, 2
+_TAG_IDS = MappingProxyType({"alias": TAG_ALIAS, "relation": TAG_RELATION})
+_TAG_NAMES = ("alias", "relation", "unclassified")
+
+def _build_ns_info(namespace: str) -> tuple:
+    return (
+        _TAG_IDS.get(TYPE_MAP.get(namespace), TAG_UNCLASSIFIED),
+        REL_NS_TO_PREDICATE.get(namespace, namespace),
+        _REL_TARGET_SCOPE.get(namespace),
+        _REL_TYPE_MAP.get(namespace),
+    )
+
+NS_INFO = MappingProxyType({
+    ns: _build_ns_info(ns)
+    for table in (TYPE_MAP, _REL_TYPE_MAP, _REL_TARGET_SCOPE, REL_NS_TO_PREDICATE)
+    for ns in table
+})
+
+def namespace_info(namespace: str) -> tuple:
+    """Dispatch tuple for a lower-cased cross-ref namespace (see ``NS_INFO``)."""
+    info = NS_INFO.get(namespace)
+    return info if info is not None else _build_ns_info(namespace)
+
+def tag_record(namespace: str) -> str:
+    """Tag a cross-ref namespace (any case) as alias/relation/unclassified."""
+    return _TAG_NAMES[namespace_info(namespace.lower())[0]]
+
+def apply_type_rule(rule, source_type: str) -> str:
+    """Evaluate a ``_REL_TYPE_MAP`` rule (constant, callable or None)."""
     if rule is None:
         return "unknown"
     return rule(source_type) if callable(rule) else rule
 
+def derive_type(namespace: str, source_type: str) -> str:
+    """Entity type of a relation target for a cross-ref namespace (any case)."""
+    return apply_type_rule(namespace_info(namespace.lower())[3], source_type)
+
 def normalize_feature_scope(od, ns: str | None) -> str:
     """Feature scope: registries are global; 'local' labels map to dataset scope; else use given ns."""
     ns = (ns or "").strip().lower()
     if not ns:
         return od.name.strip().lower()
-    if ns in REGISTRY_NS or "." in ns:
+    kind = SCOPE_KIND.get(ns)
+    if kind is _REGISTRY or "." in ns:
         return ns
-    if ns in LOCAL_NS:
+    if kind is _LOCAL:
         return od.name.strip().lower()
     return ns
 
 def alias_target_scope(rel_ns: str, src_scope: str, fallback: str) -> str:
     """Alias targets: registry/specific ns → that registry; local labels stay 
-    in the source’s dataset scope."""
-    ns = (rel_ns or "").lower()
-    if ns.startswith("db_xref:"):
-        return ns.split(":", 1)[1] or fallback
-    if ns in REGISTRY_NS:
-        return ns
-    if ns in LOCAL_NS:
+    in the source’s dataset scope. ``rel_ns`` must be lower-cased."""
+    kind = SCOPE_KIND.get(rel_ns)
+    if kind is _REGISTRY:
+        return rel_ns
+    if kind is _LOCAL:
         return src_scope
+    if rel_ns.startswith("db_xref:"):
+        return rel_ns.split(":", 1)[1] or fallback
     return fallback
 
 def relation_target_scope(rel_ns: str, fallback: str) -> str:
-    ns = (rel_ns or "").lower()
-    if ns in REL_NS_TO_REGISTRY:
-        return REL_NS_TO_REGISTRY[ns]
-    if ns in REGISTRY_NS:
-        return ns
-    if ns.startswith("db_xref:"):
-        return ns.split(":", 1)[1] or fallback
-    return fallback
\ No newline at end of file
+    scope = _REL_TARGET_SCOPE.get(rel_ns)
+    if scope is not None:
+        return scope
+    if rel_ns.startswith("db_xref:"):
+        return rel_ns.split(":", 1)[1] or fallback
+    return fallback
@@ -1,64 +1,168 @@
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; union_many falls back to Python
+    njit = None
+
+
+def _union_pairs(parent, src, dst):
+    """Union each ``(src[i], dst[i])`` in a size-weighted parent array.
+
+    Same layout and tie-breaking as ``UnionFind``: roots hold their negated
+    set size, finds use path splitting and ties attach ``dst``'s root under
+    ``src``'s.
+    """
+    for i in range(src.shape[0]):
+        ra = src[i]
+        while parent[ra] >= 0:
+            p = parent[ra]
+            grand = parent[p]
+            if grand < 0:
+                ra = p
+                break
+            parent[ra] = grand
+            ra = p
+        rb = dst[i]
+        while parent[rb] >= 0:
+            p = parent[rb]
+            grand = parent[p]
+            if grand < 0:
+                rb = p
+                break
+            parent[rb] = grand
+            rb = p
+        if ra == rb:
+            continue
+        if parent[ra] <= parent[rb]:
+            parent[ra] += parent[rb]
+            parent[rb] = ra
+        else:
+            parent[rb] += parent[ra]
+            parent[ra] = rb
+
+
+def _find_all(parent, out):
+    """Write the root of every element into ``out``, compressing paths."""
+    for i in range(parent.shape[0]):
+        root = i
+        while parent[root] >= 0:
+            root = parent[root]
+        x = i
+        while parent[x] >= 0:
+            nxt = parent[x]
+            parent[x] = root
+            x = nxt
+        out[i] = root
+    return out
+
+
+# Module-level so numba compiles (and caches) them once, not per call.
+_union_pairs_jit = njit(cache=True, nogil=True)(_union_pairs) if njit else None
+_find_all_jit = njit(cache=True, nogil=True)(_find_all) if njit else None
+
+
 class UnionFind:
-    def __init__(self):
-        """Initialize the union–find data structure.
+    def __init__(self, n: int = 0):
+        """Initialize the union–find data structure over ``n`` elements.
 
-        Creates two internal mappings:
-        - parent: maps each element to its parent (or itself if it is a root)
-        - rank: stores a heuristic depth used for efficient merging.
+        Elements are dense integer indices ``0..n-1``; callers intern their
+        own keys to indices. Storage is a single contiguous ``parent`` array:
+        a non-negative entry is the element's parent, a negative entry marks
+        a root and holds the negated size of its set.
         """
 
-        self.parent = {}
-        self.rank = {}
-
-    def find(self, x):
-        # initialize if unseen
-        if x not in self.parent:
-            self.parent[x] = x
-            self.rank[x] = 0
-            return x
-        # path compression
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-
-    def union(self, a, b):
+        self.parent = array("i", [-1]) * n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        # path splitting: point every node on the path at its grandparent
+        p = parent[x]
+        while p >= 0:
+            grand = parent[p]
+            if grand < 0:
+                return p
+            parent[x] = grand
+            x, p = p, grand
+        return x
+
+    def union(self, a: int, b: int):
         """Merge the two disjoint sets containing a and b.
 
         Args:
-            a (Hashable): First element.
-            b (Hashable): Second element.
+            a (int): Index of the first element.
+            b (int): Index of the second element.
 
         Notes:
-            Applies union by rank to maintain shallow trees.
-            If ranks are equal, one root becomes parent and its rank increases by one.
+            Applies union by size: the smaller set is attached under the
+            root of the larger one. On ties, a's root becomes the parent.
         """
         ra, rb = self.find(a), self.find(b)
         if ra == rb:
             return
-        rank_a = self.rank.get(ra, 0)
-        rank_b = self.rank.get(rb, 0)
-        if rank_a < rank_b:
-            self.parent[ra] = rb
-        elif rank_a > rank_b:
-            self.parent[rb] = ra
+        parent = self.parent
+        # sizes are stored negated, so the more negative root is larger
+        if parent[ra] <= parent[rb]:
+            parent[ra] += parent[rb]
+            parent[rb] = ra
         else:
-            self.parent[rb] = ra
-            self.rank[ra] = rank_a + 1
+            parent[rb] += parent[ra]
+            parent[ra] = rb
+
+    def union_many(self, src, dst):
+        """Merge the sets of every pair ``(src[i], dst[i])``.
+
+        Args:
+            src (array-like[int]): First element of each pair.
+            dst (array-like[int]): Second element of each pair.
+
+        Notes:
+            Equivalent to calling ``union`` pairwise in order. When numba is
+            installed the loop runs compiled, in place on ``parent``.
+        """
+        if _union_pairs_jit is not None and len(src):
+            _union_pairs_jit(
+                np.frombuffer(self.parent, dtype=np.int32),
+                np.asarray(src, dtype=np.int32),
+                np.asarray(dst, dtype=np.int32),
+            )
+            return
+        union = self.union
+        for a, b in zip(np.asarray(src).tolist(), np.asarray(dst).tolist()):
+            union(a, b)
+
+    def roots(self) -> np.ndarray:
+        """Return the root of every element as an int32 array.
+
+        Notes:
+            Fully compresses every path as a side effect.
+        """
+        n = len(self.parent)
+        if _find_all_jit is not None and n:
+            return _find_all_jit(
+                np.frombuffer(self.parent, dtype=np.int32),
+                np.empty(n, dtype=np.int32),
+            )
+        find = self.find
+        return np.fromiter((find(x) for x in range(n)), dtype=np.int32, count=n)
 
     def groups(self):
         """Return all disjoint sets currently tracked.
 
         Returns:
-            list[list[Hashable]]: A list of connected components, where each
-            inner list contains elements that share a common root.
+            list[list[int]]: A list of connected components, where each
+            inner list contains element indices that share a common root.
 
         Notes:
-            The order of groups and members is arbitrary. Path compression
-            is applied before grouping to ensure consistent roots.
+            Groups are ordered by their first member and members are in
+            ascending index order. Path compression is applied before
+            grouping to ensure consistent roots.
         """
-        out = {}
-        for node in list(self.parent.keys()):
-            root = self.find(node)
-            out.setdefault(root, []).append(node)
+        roots = self.roots().tolist()
+        # pre-create one bucket per root in first-member order, then fill
+        out = {root: [] for root in dict.fromkeys(roots)}
+        for node, root in enumerate(roots):
+            out[root].append(node)
         return list(out.values())
-
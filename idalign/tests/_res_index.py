@@ -0,0 +1,75 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+_UNSET = object()
+
+
+# ---- one-pass lookup index over an AlignmentResult (shared by test helpers) ----
+@dataclass
+class ResIndex:
+    """Lookups derived from ``res.groups`` in a single pass.
+
+    Attributes:
+        scoped: ``(namespace, identifier) -> gid``.
+        ns_by_gid: ``gid -> {namespace, ...}``.
+        sizes: ``(gid, group size)`` in group order.
+        n_nodes: Total number of group members.
+        dupes: ``((namespace, identifier), first_gid, other_gid)`` for scoped
+            IDs found in more than one group (empty for a valid result).
+        type_by_gid: ``gid -> type`` shared by every member, ``None`` if mixed.
+        unknown_nodes: Number of members whose type is ``"unknown"``.
+        ns_coverage: ``namespace -> number of groups containing it``.
+    """
+
+    scoped: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    ns_by_gid: Dict[int, Set[str]] = field(default_factory=dict)
+    sizes: List[Tuple[int, int]] = field(default_factory=list)
+    n_nodes: int = 0
+    dupes: List[Tuple[Tuple[str, str], int, int]] = field(default_factory=list)
+    type_by_gid: Dict[int, Optional[str]] = field(default_factory=dict)
+    unknown_nodes: int = 0
+    ns_coverage: Counter = field(default_factory=Counter)
+
+
+def build_index(res) -> ResIndex:
+    """Return the ``ResIndex`` for ``res``, building it on first use.
+
+    The index is cached on the result object; results are not mutated after
+    ``match_references`` returns, so it stays valid for the result's lifetime.
+    """
+    idx = getattr(res, "_res_index", None)
+    if idx is not None:
+        return idx
+
+    idx = ResIndex()
+    scoped, ns_by_gid, sizes, dupes = idx.scoped, idx.ns_by_gid, idx.sizes, idx.dupes
+    type_by_gid = idx.type_by_gid
+    n_nodes = unknown_nodes = 0
+    for gid, members in res.groups.items():
+        namespaces = set()
+        group_t = _UNSET
+        for n in members:
+            k = (n.namespace, n.identifier)
+            seen = scoped.setdefault(k, gid)
+            if seen != gid:
+                dupes.append((k, seen, gid))
+            namespaces.add(n.namespace)
+            t = getattr(n, "type", "unknown")
+            if t == "unknown":
+                unknown_nodes += 1
+            if group_t is _UNSET:
+                group_t = t
+            elif group_t != t:
+                group_t = None
+        ns_by_gid[gid] = namespaces
+        type_by_gid[gid] = None if group_t is _UNSET else group_t
+        sizes.append((gid, len(members)))
+        n_nodes += len(members)
+
+    idx.n_nodes = n_nodes
+    idx.unknown_nodes = unknown_nodes
+    for namespaces in ns_by_gid.values():
+        idx.ns_coverage.update(namespaces)
+    res._res_index = idx
+    return idx
@@ -4,6 +4,7 @@ sys.path.insert(0, "..")
 sys.path.insert(0, "../..")
 
 from idalign.aligner import match_references
+from _res_index import build_index
 
 # ---- lightweight dummies matching matcher input shape ----
 class XRef:
@@ -29,27 +30,14 @@ class DummyOD:
 
 # ---- helpers against AlignmentResult ----
 def find_gid(res, namespace, ident):
-    for gid, members in res.groups.items():
-        for n in members:
-            if n.namespace == namespace and n.identifier == ident:
-                return gid
-    return None
+    return build_index(res).scoped.get((namespace, ident))
 
 def group_type(res, gid):
-    types = {getattr(n, "type", "unknown") for n in res.groups[gid]}
-    return next(iter(types)) if len(types) == 1 else "mixed/unknown"
+    t = build_index(res).type_by_gid[gid]
+    return "mixed/unknown" if t is None else t
 
 def scoped_id_dupes(res):
-    seen = {}
-    dupes = []
-    for gid, members in res.groups.items():
-        for n in members:
-            k = (n.namespace, n.identifier)
-            if k in seen and seen[k] != gid:
-                dupes.append((k, seen[k], gid))
-            else:
-                seen[k] = gid
-    return dupes
+    return list(build_index(res).dupes)
 
 def same_group_relations(res):
     return [ (ga, rel, gb, c) for (ga, rel, gb), c in res.group_relations.items() if ga == gb ]
@@ -1,9 +1,13 @@
 import unittest
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
+import numpy as np
 sys.path.insert(0, "..")
 sys.path.insert(0, "../..")
 from idalign.aligner import match_references
+from _res_index import build_index
 from omics_io.omics_io.parsers.reference.genbank import parse_genbank
 from omics_io.omics_io.parsers.reference.gff3 import parse_gff3
 from omics_io.omics_io.parsers.transcriptomics.precise2 import parse_precise2
@@ -13,13 +17,33 @@ from idalign.aligner import match_references
 
 
 # ---------- helpers (same assertions reused across scenarios) ----------
+_MR_CACHE = {}
+
+def _mr(*datasets):
+    """``match_references`` memoised on the identity of its inputs.
+
+    Scenarios reuse the same parsed datasets as baselines, so each
+    combination is aligned once per run. The inputs are kept in the cache
+    entry so their ids cannot be recycled while it is live.
+    """
+    key = tuple(id(d) for d in datasets)
+    hit = _MR_CACHE.get(key)
+    if hit is None:
+        hit = _MR_CACHE[key] = (datasets, match_references(*datasets))
+    return hit[1]
+
 def summarize_alignment(res) -> dict:
-    sizes = [len(m) for m in res.groups.values()]
-    n_groups = len(res.groups)
-    n_nodes = sum(sizes)
-    singletons = sum(1 for s in sizes if s == 1)
-    max_size = max(sizes) if sizes else 0
-    unknown_nodes = sum(1 for n in res.node_to_gid if getattr(n, "type", "unknown") == "unknown")
+    idx = build_index(res)
+    n_groups = len(idx.sizes)
+    sizes = np.fromiter((s for _, s in idx.sizes), dtype=np.int64, count=n_groups)
+    n_nodes = idx.n_nodes
+    singletons = int(np.count_nonzero(sizes == 1))
+    max_size = int(sizes.max(initial=0))
+    unknown_nodes = idx.unknown_nodes
+    n_rel_edges_total = int(
+        np.fromiter(res.group_relations.values(), dtype=np.int64,
+                    count=len(res.group_relations)).sum()
+    )
     return {
         "n_groups": n_groups,
         "n_nodes": n_nodes,
@@ -28,35 +52,23 @@ def summarize_alignment(res) -> dict:
         "max_group_size": max_size,
         "unknown_type_nodes": unknown_nodes,
         "n_rel_triplets": len(res.group_relations),
-        "n_rel_edges_total": sum(res.group_relations.values()),
+        "n_rel_edges_total": n_rel_edges_total,
     }
 
 def scoped_id_dupes(res):
-    seen = {}
-    dupes = []
-    for gid, members in res.groups.items():
-        for n in members:
-            k = (n.namespace, n.identifier)
-            if k in seen and seen[k] != gid:
-                dupes.append((k, seen[k], gid))
-            else:
-                seen[k] = gid
-    return dupes
+    return list(build_index(res).dupes)
 
 def same_group_relations(res):
     return [ (ga, rel, gb, c) for (ga, rel, gb), c in res.group_relations.items() if ga == gb ]
 
 def find_gid(res, namespace, ident):
-    for gid, members in res.groups.items():
-        if any(n.namespace == namespace and n.identifier == ident for n in members):
-            return gid
-    return None
+    return build_index(res).scoped.get((namespace, ident))
 
 def assert_common_invariants(testcase: unittest.TestCase, res, label: str):
     m = summarize_alignment(res)
     # Basic sanity
     testcase.assertGreater(m["n_groups"], 0, f"[{label}] expected >0 groups")
-    testcase.assertEqual(m["n_nodes"], sum(len(s) for s in res.groups.values()), f"[{label}] node count mismatch")
+    testcase.assertEqual(m["n_nodes"], len(res.node_to_gid), f"[{label}] node count mismatch")
     # No duplicate scoped IDs across groups
     testcase.assertEqual(scoped_id_dupes(res), [], f"[{label}] duplicate scoped IDs across groups")
     # No self-loops after grouping
@@ -92,18 +104,25 @@ class TestAlignerE2E(unittest.TestCase):
         if missing:
             raise unittest.SkipTest(f"Skipping E2E: missing files: {missing}")
 
-        # Parse once
-        cls.sequence_data = parse_genbank(cls.p_gbk)
-        cls.gff_data      = parse_gff3(cls.p_gff)
-        cls.trans_data    = parse_precise2(cls.p_txp, presence_path=cls.p_txp_pres, metadata_path=cls.p_txp_meta)
-        cls.prot1         = parse_mztab(cls.p_mztab1)
-        cls.prot2         = parse_mztab(cls.p_mztab2)
-        cls.prot3         = parse_mztab(cls.p_mztab3)
-        cls.meta          = parse_metabolomics(cls.p_meta, mapping_path=cls.p_map)
+        # Parse once; the files are independent, so parse them in parallel
+        tasks = {
+            "sequence_data": (parse_genbank, (cls.p_gbk,), {}),
+            "gff_data":      (parse_gff3, (cls.p_gff,), {}),
+            "trans_data":    (parse_precise2, (cls.p_txp,), {"presence_path": cls.p_txp_pres, "metadata_path": cls.p_txp_meta}),
+            "prot1":         (parse_mztab, (cls.p_mztab1,), {}),
+            "prot2":         (parse_mztab, (cls.p_mztab2,), {}),
+            "prot3":         (parse_mztab, (cls.p_mztab3,), {}),
+            "meta":          (parse_metabolomics, (cls.p_meta,), {"mapping_path": cls.p_map}),
+        }
+        workers = min(8, len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            futs = {name: ex.submit(fn, *args, **kw) for name, (fn, args, kw) in tasks.items()}
+            for name, fut in futs.items():
+                setattr(cls, name, fut.result())
 
     # 1) Single dataset (GBK)
     def test_01_gbk_only(self):
-        res = match_references(self.sequence_data)
+        res = _mr(self.sequence_data)
         assert_common_invariants(self, res, "GBK-only")
         # Expect many singletons and typical max group size ~5 (symbol/locus_tag/GeneID/etc.)
         m = summarize_alignment(res)
@@ -112,21 +131,22 @@ class TestAlignerE2E(unittest.TestCase):
 
     # 2) Two genomics sources (GBK + GFF3)
     def test_02_gbk_plus_gff(self):
-        res = match_references(self.sequence_data, self.gff_data)
+        res = _mr(self.sequence_data, self.gff_data)
         assert_common_invariants(self, res, "GBK+GFF")
         m = summarize_alignment(res)
         # Adding GFF should not reduce mean group size
-        res_gbk = match_references(self.sequence_data)
+        res_gbk = _mr(self.sequence_data)
         m_gbk = summarize_alignment(res_gbk)
         self.assertGreaterEqual(m["mean_group_size"], m_gbk["mean_group_size"], "[GBK+GFF] mean group size should not drop")
 
         # Cross-dataset registry merge check (best-effort): if any GeneID exists, it should map to exactly one GID
         # (We don't hardcode a specific GeneID; we verify consistency for the first few)
+        scoped = build_index(res).scoped
         checked = 0
         for gid, members in res.groups.items():
             for n in members:
                 if n.namespace == "geneid":
-                    gid_again = find_gid(res, "geneid", n.identifier)
+                    gid_again = scoped.get(("geneid", n.identifier))
                     self.assertEqual(gid, gid_again, f"[GBK+GFF] GeneID {n.identifier} split across groups")
                     checked += 1
                     if checked >= 10:
@@ -136,17 +156,17 @@ class TestAlignerE2E(unittest.TestCase):
 
     # 3) Genomics + Transcriptomics
     def test_03_gen_plus_transcriptomics(self):
-        res = match_references(self.sequence_data, self.gff_data, self.trans_data)
+        res = _mr(self.sequence_data, self.gff_data, self.trans_data)
         assert_common_invariants(self, res, "Gen+Trans")
         m = summarize_alignment(res)
         # Adding transcriptomics should increase relations or at least keep them same
-        res_gen = match_references(self.sequence_data, self.gff_data)
+        res_gen = _mr(self.sequence_data, self.gff_data)
         m_gen = summarize_alignment(res_gen)
         self.assertGreaterEqual(m["n_rel_edges_total"], m_gen["n_rel_edges_total"], "[Gen+Trans] relations should not decrease")
 
     # 4) All omics (Gen + Trans + Proteomics + Metabolomics)
     def test_04_all_omics(self):
-        res = match_references(
+        res = _mr(
             self.sequence_data, self.gff_data, self.trans_data,
             self.prot1, self.prot2, self.prot3, self.meta
         )
@@ -154,7 +174,7 @@ class TestAlignerE2E(unittest.TestCase):
         m = summarize_alignment(res)
 
         # Compare to Gen+Trans: expect more nodes and typically more relations
-        res_gen_tx = match_references(self.sequence_data, self.gff_data, self.trans_data)
+        res_gen_tx = _mr(self.sequence_data, self.gff_data, self.trans_data)
         m_gen_tx = summarize_alignment(res_gen_tx)
         self.assertGreaterEqual(m["n_nodes"], m_gen_tx["n_nodes"], "[All-omics] nodes should increase")
         self.assertGreaterEqual(m["n_rel_edges_total"], m_gen_tx["n_rel_edges_total"], "[All-omics] relations should not decrease")
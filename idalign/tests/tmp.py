@@ -1,7 +1,9 @@
 import unittest
+import heapq
 import sys
 import tempfile
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from collections import Counter
 
@@ -11,6 +13,7 @@ sys.path.insert(0, "../..")
 
 from idalign.aligner import match_references
 from idalign.mapping_data import Node, AlignmentResult
+from _res_index import build_index
 from omics_io.omics_io.parsers.reference.genbank import parse_genbank
 from omics_io.omics_io.parsers.reference.gff3 import parse_gff3
 from omics_io.omics_io.parsers.transcriptomics.precise2 import parse_precise2
@@ -27,12 +30,17 @@ from pathlib import Path
 # assumes: parse_genbank, match_references, AlignmentResult, Node imported
 
 def summarize_alignment(res) -> Dict[str, float]:
-    n_groups = len(res.groups)
-    sizes = [len(m) for m in res.groups.values()]
-    n_nodes = sum(sizes)
-    singletons = sum(1 for s in sizes if s == 1)
-    max_size = max(sizes) if sizes else 0
-    unknown_nodes = sum(1 for n in res.node_to_gid if getattr(n, "type", "unknown") == "unknown")
+    idx = build_index(res)
+    n_groups = len(idx.sizes)
+    sizes = np.fromiter((s for _, s in idx.sizes), dtype=np.int64, count=n_groups)
+    n_nodes = idx.n_nodes
+    singletons = int(np.count_nonzero(sizes == 1))
+    max_size = int(sizes.max(initial=0))
+    unknown_nodes = idx.unknown_nodes
+    n_rel_edges_total = int(
+        np.fromiter(res.group_relations.values(), dtype=np.int64,
+                    count=len(res.group_relations)).sum()
+    )
     return {
         "n_groups": n_groups,
         "n_nodes": n_nodes,
@@ -42,45 +50,41 @@ def summarize_alignment(res) -> Dict[str, float]:
         "unknown_type_nodes": unknown_nodes,
         "unknown_type_frac": (unknown_nodes / n_nodes) if n_nodes else 0.0,
         "n_rel_triplets": len(res.group_relations),
-        "n_rel_edges_total": sum(res.group_relations.values()),
+        "n_rel_edges_total": n_rel_edges_total,
     }
 
 def group_size_hist(res) -> Dict[int, int]:
-    return dict(Counter(len(m) for m in res.groups.values()))
+    return dict(Counter(s for _, s in build_index(res).sizes))
 
 def namespaces_per_group(res) -> Dict[int, Set[str]]:
-    out = {}
-    for gid, members in res.groups.items():
-        out[gid] = {n.namespace for n in members}
-    return out
+    return build_index(res).ns_by_gid
 
 def mixed_namespace_groups(res) -> List[int]:
     return [gid for gid, nss in namespaces_per_group(res).items() if len(nss) > 1]
 
 def groups_with_unknown_type(res) -> List[int]:
-    out = []
-    for gid, members in res.groups.items():
-        types = {getattr(n, "type", "unknown") for n in members}
-        if len(types) != 1 or "unknown" in types:
-            out.append(gid)
-    return out
+    return [g for g, t in build_index(res).type_by_gid.items() if t in (None, "unknown")]
 
 def top_groups_by_size(res, k: int = 10) -> List[Tuple[int, int]]:
-    sizes = [(gid, len(members)) for gid, members in res.groups.items()]
-    return sorted(sizes, key=lambda x: x[1], reverse=True)[:k]
+    return heapq.nlargest(k, build_index(res).sizes, key=lambda x: x[1])
 
 def print_group(res, gid: int, limit: Optional[int] = 20) -> None:
-    members = sorted(res.groups[gid], key=lambda n: (n.namespace, n.identifier))
-    print(f"G{gid} size={len(members)} type={_group_type(res, gid)}")
-    for i, n in enumerate(members):
-        if limit is not None and i >= limit:
-            print("  ...")
-            break
+    group = res.groups[gid]
+    key = lambda n: (n.namespace, n.identifier)
+    # only the printed prefix needs ordering
+    if limit is not None and limit < len(group):
+        members = heapq.nsmallest(limit, group, key=key)
+    else:
+        members = sorted(group, key=key)
+    print(f"G{gid} size={len(group)} type={_group_type(res, gid)}")
+    for n in members:
         print(f"  {n.namespace}\t{n.identifier}\t{getattr(n,'type','unknown')}")
+    if len(members) < len(group):
+        print("  ...")
 
 def _group_type(res, gid: int) -> str:
-    types = {getattr(n, "type", "unknown") for n in res.groups[gid]}
-    return next(iter(types)) if len(types) == 1 else "mixed/unknown"
+    t = build_index(res).type_by_gid[gid]
+    return "mixed/unknown" if t is None else t
 
 def relation_stats(res) -> Dict[str, int]:
     by_rel = defaultdict(int)
@@ -97,20 +101,18 @@ def degree_by_group(res) -> Dict[int, Dict[str, int]]:
 
 def verify_cross_dataset_alias(res, namespace: str, ident: str) -> List[int]:
     """Return all gids that contain (namespace, ident). Expect length 1 if merged."""
-    gids = []
-    for gid, members in res.groups.items():
-        if any((n.namespace == namespace and n.identifier == ident) for n in members):
-            gids.append(gid)
-    return gids
+    idx = build_index(res)
+    key = (namespace, ident)
+    gid = idx.scoped.get(key)
+    if gid is None:
+        return []
+    return list(dict.fromkeys([gid, *(g for k, _, g in idx.dupes if k == key)]))
 def assert_unique_scoped_ids(res):
-    seen = {}
-    for gid, members in res.groups.items():
-        for n in members:
-            k = (n.namespace, n.identifier)
-            if k in seen and seen[k] != gid:
-                raise AssertionError(f"Scoped ID {k} in multiple groups: {seen[k]} and {gid}")
-            seen[k] = gid
-    return len(seen)
+    idx = build_index(res)
+    if idx.dupes:
+        k, first, other = idx.dupes[0]
+        raise AssertionError(f"Scoped ID {k} in multiple groups: {first} and {other}")
+    return len(idx.scoped)
 
 def same_group_relations(res):
     return [ (ga, rel, gb, c)
@@ -118,19 +120,13 @@ def same_group_relations(res):
              if ga == gb ]
 
 def groups_missing_registry(res, registry="geneid"):
-    return [ (gid, sorted((n.namespace, n.identifier) for n in members))
-             for gid, members in res.groups.items()
-             if any(n.namespace in {"gene","locus_tag"} for n in members)
-             and all(n.namespace != registry for n in members) ]
+    return [ (gid, sorted((n.namespace, n.identifier) for n in res.groups[gid]))
+             for gid, nss in build_index(res).ns_by_gid.items()
+             if not nss.isdisjoint(("gene", "locus_tag"))
+             and registry not in nss ]
 
 def coverage_by_registry(res):
-    from collections import Counter
-    cnt = Counter()
-    for gid, members in res.groups.items():
-        regs = {n.namespace for n in members}
-        for r in regs:
-            cnt[r] += 1
-    return dict(cnt)
+    return dict(build_index(res).ns_coverage)
 
 
 
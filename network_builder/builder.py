@@ -1,8 +1,11 @@
 import yaml
 from pathlib import Path
 import math
-import os
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+
+import numpy as np
 
 from neo4j_interface.storage import Neo4jStorage
 from neo4j_interface.utils.storage_objects import RelationshipRow, NodeRow
@@ -10,18 +13,27 @@ from network_builder.utils.network_builder_convention import NetworkBuilderConve
 from omics_io.omics_io.identifiers import IDS
 from omics_io.omics_io.parse_obj import OmicData
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 config_path = Path(__file__).parent / "config.yaml"
 
-with open(config_path, "r") as f:
-    config = yaml.safe_load(f)
+
+@lru_cache(maxsize=None)
+def _load_config(path=config_path):
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+config = _load_config()
 
 url = config["STORAGE"]["uri"]
 username = config["STORAGE"]["username"]
 password = config["STORAGE"]["password"]
 
 matrix_store = "measure_store"
-if not os.path.isdir(matrix_store):
-    os.mkdir(matrix_store)
 
 # Things to consider (No order)
 
@@ -33,16 +45,35 @@ if not os.path.isdir(matrix_store):
 # I reckon, youd end up file system storing it and linking in the MD.
 # Like Matrix: "blabla_filename". Decide if attach to node above or below.
 
+P_ALIAS = IDS.predicates.alias
+P_CONFIDENCE = IDS.predicates.confidence
+
 c50 = 5
 K = math.log(2) / max(1e-9, c50)
 
 
+# confidences for the small counts most relations have, as Python floats
+_CONF_TABLE = (-np.expm1(-K * np.arange(256, dtype=np.float64))).tolist()
+
+
 def _count_to_conf(count):
-    return 1 - math.exp(-K * count)
+    """Confidence ``1 - exp(-K * count)`` for one real ``count``."""
+    if type(count) is int and 0 <= count < len(_CONF_TABLE):
+        return _CONF_TABLE[count]
+    # -expm1(-x) == 1 - exp(-x) without cancellation for small x
+    return -math.expm1(-K * count)
+
+
+def _counts_to_conf(counts):
+    """Vectorised ``_count_to_conf`` over an array of counts."""
+    return -np.expm1(-K * np.asarray(counts, dtype=np.float64))
 
 
 class OmicGraphBuilder:
     def __init__(self):
+        # created here, not at import, so importing the module for its
+        # helpers leaves the filesystem alone
+        Path(matrix_store).mkdir(parents=True, exist_ok=True)
         self._storage = Neo4jStorage(
             url,
             username=username,
@@ -53,29 +84,25 @@ class OmicGraphBuilder:
     def add_omic_set(self, dataset : OmicData):
         nodes_by_label = defaultdict(dict)
         rel_rows = []
-        mat_fn = Path(f"{matrix_store}/{dataset.name}")
-        self._storage.upsert_node(dataset.omics_type, 
-                                  dataset.name, 
+        name = dataset.name
+        omics_type = dataset.omics_type
+        mat_fn = Path(f"{matrix_store}/{name}")
+        self._storage.upsert_node(omics_type, 
+                                  name, 
                                   props={"location": str(mat_fn)})
-        for ele, md in dataset.features():
+        # features and columns are handled alike; build each NodeRow as
+        # it is seen (a repeated id keeps its latest properties)
+        for ele, md in chain(dataset.features(), dataset.columns()):
             label = md.entity
-            nodes_by_label[label][ele] = md.properties
-            rel_rows.append(RelationshipRow(dataset.name, 
+            nodes_by_label[label][ele] = NodeRow(ele, md.properties)
+            rel_rows.append(RelationshipRow(name, 
                                             ele, 
                                             None,
-                                            dataset.omics_type,
+                                            omics_type,
                                             label))
-        for ele,md in dataset.columns():
-            nodes_by_label[md.entity][ele] = md.properties
-            rel_rows.append(RelationshipRow(dataset.name, 
-                                            ele, 
-                                            None,
-                                            dataset.omics_type,
-                                            md.entity))
 
-        for label, idmap in nodes_by_label.items():
-            rows = [NodeRow(_id,p) for _id, p in idmap.items()]
-            self._storage.upsert_nodes(label, rows)
+        for label, rows in nodes_by_label.items():
+            self._storage.upsert_nodes(label, list(rows.values()))
         self._storage.upsert_relationships(IDS.predicates.has_feature, 
                                            rel_rows)
 
@@ -88,33 +115,43 @@ class OmicGraphBuilder:
         all_ids = set()
         groups = []
         for gid, nodes in alignment_data:
-            ids = list(set([n.identifier for n in nodes]))
-            types = list(set([n.type for n in nodes]))
-            groups.append((gid, ids,types))
+            ids = list(dict.fromkeys(n.identifier for n in nodes))
+            types = {n.type for n in nodes}
+            types.discard("unknown")
+            groups.append((gid, ids, types))
             all_ids.update(ids)
 
-        existing = {n.id: n for n in 
-                    self._storage.find_nodes(ids=list(all_ids))}
-        existing_set = set(existing.keys())
+        # only the ids of existing nodes are needed; skip the round trip
+        # when there is nothing to look up
+        if all_ids:
+            existing_set = {n.id for n in 
+                            self._storage.find_nodes(ids=list(all_ids))}
+        else:
+            existing_set = frozenset()
 
         # B) resolve groups; defer unknown creation and alias adds
         alias_adds = defaultdict(list)
+        # groups with the same ids and type resolve to the same node
+        resolved = {}
         for gid, ids, types in groups:
-            ids = list(set(ids))
-            have = [i for i in ids if i in existing_set]
-            type = [t for t in types if t != "unknown"]
-            assert(len(type) <= 1)
-            if len(type) == 0:
-                type = None
-            else:
-                type = type[0]
+            assert(len(types) <= 1)
+            type = next(iter(types), None)
+            key = (frozenset(ids), type)
+            if key in resolved:
+                gid_to_nid[gid] = resolved[key]
+                continue
+            have, missing = [], []
+            for i in ids:
+                (have if i in existing_set else missing).append(i)
             if len(have) == 0:
-                gid_to_nid[gid] = [ids[0],type]
+                # smallest id: independent of set order and hash seed, so
+                # rebuilds name the node the same way
+                rep = min(ids)
+                gid_to_nid[gid] = [rep,type]
                 if type is None:
-                    unknown_ids.append(ids[0])
-                    unknown_rows.append(NodeRow(ids[0], 
-                                            {IDS.predicates.alias: 
-                                             ids}))
+                    unknown_ids.append(rep)
+                    unknown_rows.append(NodeRow(rep, 
+                                            {P_ALIAS: ids}))
             else:
                 if len(have) > 1:
                     f_node = self._storage.merge_nodes(have,label=type)
@@ -124,50 +161,107 @@ class OmicGraphBuilder:
                     node_id = have[0]
                     node_label = type
                 gid_to_nid[gid] = (node_id,node_label)
-                missing = [i for i in ids if i not in have]
                 if missing:
                     alias_adds[node_id].extend(missing)
+            resolved[key] = gid_to_nid[gid]
 
         if unknown_rows:
             self._storage.upsert_nodes(IDS.type.unknown, 
                                        unknown_rows)
         # batch alias additions per node
         for nid, aliases in alias_adds.items():
-            self._storage.add_property(nid, IDS.predicates.alias, 
-                                       list(set(aliases)))
-
-        # C) pre-aggregate relationships to dedupe
-        rel_bins = defaultdict(list)
-        agg = defaultdict(int)
-        for g1, rel, g2, cnt in alignment_data.relationships():
-            if g1 == g2:
-                continue
-            s_id,s_type = gid_to_nid.get(g1)
-            t_id,t_type = gid_to_nid.get(g2)
-            if s_id is None or t_id is None:
-                raise ValueError(f"Cant find:{s_id},{t_id}")
-            agg[(rel, s_id, t_id, s_type, t_type)] += cnt
-
-        for (rel, s_id, t_id,s_type, t_type), tot in agg.items():
-            element = RelationshipRow(s_id,
-                                     t_id,
-                                     {IDS.predicates.confidence: 
-                                      _count_to_conf(tot)},
-                                     _normalize_labels(s_type),
-                                     _normalize_labels(t_type))
-
-            rel_bins[rel].append(element)
+            self._storage.add_property(nid, P_ALIAS, 
+                                       list(dict.fromkeys(aliases)))
+
+        # C) pre-aggregate relationships to dedupe. Groups resolved to the
+        # same node share a code, so duplicate (rel, source, target) triples
+        # collapse in one np.unique pass and their counts in one bincount.
+        node_code = {}
+        gid_index = np.full(max(gid_to_nid, default=-1) + 1, -1, dtype=np.int64)
+        for gid, nid in gid_to_nid.items():
+            gid_index[gid] = node_code.setdefault(tuple(nid), len(node_code))
+        node_keys = list(node_code)
+
+        rel_bins = {}
+        edges = list(alignment_data.relationships())
+        if edges:
+            g1, rels, g2, cnt = zip(*edges)
+            g1 = np.array(g1, dtype=np.int64)
+            g2 = np.array(g2, dtype=np.int64)
+            rel_names = list(dict.fromkeys(rels))
+            rel_idx = {r: i for i, r in enumerate(rel_names)}
+            rel_arr = np.fromiter(map(rel_idx.__getitem__, rels),
+                                  dtype=np.int64, count=len(rels))
+            keep = g1 != g2
+            g1, g2 = g1[keep], g2[keep]
+            s_code = _gid_codes(gid_index, g1)
+            t_code = _gid_codes(gid_index, g2)
+            for g, code in ((g1, s_code), (g2, t_code)):
+                miss = np.flatnonzero(code < 0)
+                if miss.size:
+                    raise ValueError(f"Cant find:{int(g[miss[0]])}")
+
+            uniq, inverse = _unique_triples(rel_arr[keep], s_code, t_code,
+                                            len(rel_names), len(node_keys))
+            totals = np.bincount(inverse,
+                                 weights=np.asarray(cnt, dtype=np.float64)[keep],
+                                 minlength=len(uniq))
+            confs = _counts_to_conf(totals).tolist()
+            # node types take few distinct values; normalise each once
+            labels = {}
+            for _, node_type in node_keys:
+                if node_type not in labels:
+                    labels[node_type] = _normalize_labels(node_type)
+            ends = [(nid, labels[node_type]) for nid, node_type in node_keys]
+            end = ends.__getitem__
+
+            # uniq is sorted by rel first, so each relationship label is one
+            # contiguous run; build its row list in one go
+            r_col, s_col, t_col = uniq.T.tolist()
+            cuts = (np.flatnonzero(np.diff(uniq[:, 0])) + 1).tolist()
+            starts = [0, *cuts] if confs else []
+            for a, b in zip(starts, [*cuts, len(confs)]):
+                rel_bins[rel_names[r_col[a]]] = [
+                    RelationshipRow(s_id,
+                                    t_id,
+                                    {P_CONFIDENCE: conf},
+                                    s_labels,
+                                    t_labels)
+                    for (s_id, s_labels), (t_id, t_labels), conf
+                    in zip(map(end, s_col[a:b]), map(end, t_col[a:b]),
+                           confs[a:b])]
 
         for rel_label, rows in rel_bins.items():
             self._storage.upsert_relationships(rel_label, rows)
         return unknown_ids
 
+def _unique_triples(rels, srcs, tgts, n_rels, n_nodes):
+    """Distinct ``(rel, src, tgt)`` code rows and the inverse index into them."""
+    if n_rels * n_nodes * n_nodes <= np.iinfo(np.int64).max:
+        # pack each triple into one int64: a 1-D unique is far cheaper
+        # than np.unique(axis=0), which sorts the rows as opaque bytes
+        packed = (rels * n_nodes + srcs) * n_nodes + tgts
+        keys, inverse = np.unique(packed, return_inverse=True)
+        rs, t = np.divmod(keys, n_nodes)
+        r, s = np.divmod(rs, n_nodes)
+        return np.stack((r, s, t), axis=1), inverse.ravel()
+    triples = np.stack((rels, srcs, tgts), axis=1)
+    uniq, inverse = np.unique(triples, axis=0, return_inverse=True)
+    return uniq, inverse.ravel()
+
+def _gid_codes(index, gids):
+    """Map ``gids`` through the dense ``gid -> node code`` array; -1 marks a miss."""
+    codes = np.full(len(gids), -1, dtype=np.int64)
+    inside = gids < len(index)
+    codes[inside] = index[gids[inside]]
+    return codes
+
 def _normalize_labels(x):
     if not x:
         return []
     if isinstance(x, str):
-        candidates = [x]
-    else:
-        candidates = list(x)
-    labels = [str(v).strip() for v in candidates if v is not None and str(v).strip() != ""]
-    return labels
\ No newline at end of file
+        # common case: a single label string
+        label = x.strip()
+        return [label] if label else []
+    labels = (str(v).strip() for v in x if v is not None)
+    return [label for label in labels if label]
\ No newline at end of file
@@ -4,6 +4,7 @@ from omics_io.omics_io.identifiers import IDS
 from neo4j_interface.utils.storage_objects import RelationshipRow
 
 P_ALIAS = IDS.predicates.alias
+P_PRODUCT = IDS.predicates.product
 
 def clean_network(storage:Neo4jStorage):
     '''
@@ -53,23 +54,19 @@ def _connect_layers(storage:Neo4jStorage):
 def _handle_no_node(storage:Neo4jStorage,node:NodeObject):
     # Note see we have with_relationships
     if len(node.relationships) != 0:
-        print(f"Found Unknown with no similar nodes {node} but with rels...")
-        exit()
+        raise ValueError(f"Found Unknown with no similar nodes {node} but with rels...")
     
     rels = storage.find_relationships(right_id=node.id)
     if len(rels) != 0:
-        print(f"Found Unknown with no similar nodes {node} but with incoming rels...")
-        exit()
+        raise ValueError(f"Found Unknown with no similar nodes {node} but with incoming rels...")
 
     lab_node = storage.find_nodes(node.id)
     if len(lab_node) != 0:
-        print(f"Found Unknown {node} but with different label. ")
-        exit()
+        raise ValueError(f"Found Unknown {node} but with different label. ")
 
     alias_nodes = storage.find_nodes(node.properties.get(P_ALIAS))
     if len(alias_nodes) != 0:
-        print(f"Found Unknown {node} but with different label. ")
-        exit()
+        raise ValueError(f"Found Unknown {node} but with different label. ")
 
 def _handle_unknown_nodes(storage:Neo4jStorage):
     '''
@@ -85,43 +82,51 @@ def _handle_unknown_nodes(storage:Neo4jStorage):
     direct_merges = []
     results = {"Direct Label Merge" : direct_merges}
     for i in storage.find_nodes(label=IDS.type.unknown,with_relationships=True):
-        existing_nodes = list_diff(storage.find_nodes([i.id]), [i])
+        existing_nodes = [n for n in storage.find_nodes([i.id]) if n != i]
         if len(existing_nodes) == 0:
             _handle_no_node(storage,i)
-        if len(existing_nodes) == 1:
+        elif len(existing_nodes) == 1:
             storage.merge_nodes([i.id],
                                 canonical_label=existing_nodes[0].label)
             direct_merges.append(i.id)
         else:
-            print(f"Found Unknown with multiple similar nodes {i} - {existing_nodes}")
-            exit()
-            i_layer = _find_layer(storage,i)
-            for e in existing_nodes:
-                e_layer = _find_layer(storage,e)
+            raise ValueError(f"Found Unknown with multiple similar nodes {i} - {existing_nodes}")
 
     return results
 
 def _handle_multiple_products(storage:Neo4jStorage):
         # Assume gene has single product (Prokaryotes),
-        prot_fams = []
+        multi = []
         for i in storage.find_nodes(label=IDS.type.rna,with_relationships=True):
-            if IDS.predicates.product in i.relationships:
-                products = i.relationships[IDS.predicates.product]
-                to_add = []
-                to_merge = []
+            if P_PRODUCT in i.relationships:
+                products = i.relationships[P_PRODUCT]
                 if len(products) > 1:
-                    for p in products:
-                        p_rels = storage.find_relationships(right_id=p)
-                        if len(p_rels) > 1:
-                            to_add.append(p)
-                            prot_fams.append(p)
-                        else:
-                            to_merge.append(p)
-                    m_node = storage.merge_nodes(to_merge)
-                    for a in to_add:
-                        storage.add_property(m_node.id,
-                                             IDS.predicates.alias,
-                                             a,m_node.label)
+                    multi.append(products)
+
+        # Probe each product's incoming relationships once, before any
+        # merge. Only products with a single incoming edge are merged and
+        # those belong to one RNA, so the counts are unaffected by merges.
+        n_incoming = {}
+        for products in multi:
+            for p in products:
+                if p not in n_incoming:
+                    n_incoming[p] = len(storage.find_relationships(right_id=p))
+
+        prot_fams = []
+        for products in multi:
+            to_add = []
+            to_merge = []
+            for p in products:
+                if n_incoming[p] > 1:
+                    to_add.append(p)
+                    prot_fams.append(p)
+                else:
+                    to_merge.append(p)
+            m_node = storage.merge_nodes(to_merge)
+            for a in to_add:
+                storage.add_property(m_node.id,
+                                     P_ALIAS,
+                                     a,m_node.label)
         storage.remove_nodes(prot_fams,label=IDS.type.protein)
 
 def _find_layer(storage:Neo4jStorage,node):
@@ -131,6 +136,3 @@ def _find_layer(storage:Neo4jStorage,node):
             if o_t is not None:
                 raise ValueError(f'{node} has multiple layers.')
             o_t = r.end_id.type
-
-def list_diff(l1, l2):
-    return [x for x in l1 if x not in l2]
\ No newline at end of file
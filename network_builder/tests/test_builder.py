@@ -1,5 +1,6 @@
 import unittest
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 sys.path.insert(0, "..")
@@ -27,6 +28,21 @@ class TestNetworkBuilder(unittest.TestCase):
         cls.storage = Neo4jStorage(url, username=username, 
                                    password=password,
                                    convention=NetworkBuilderConvention())
+        # Parse each input once; OmicData is frozen, so tests can share it.
+        cls.sequence_data = parse_genbank(Path("data/sequence.gb"))
+        cls.gff_data = parse_gff3(Path("data/sequence.gff3"))
+        cls.trans_data = parse_precise2(
+            Path("data/expression_tpm_log.csv"),
+            presence_path=Path("data/gene_presence_matrix_bool.csv"),
+            metadata_path=Path("data/samples_metadata.csv"),
+        )
+        cls.prot1 = parse_mztab(Path("data/F020490.pride.mztab"))
+        cls.prot2 = parse_mztab(Path("data/F020549.pride.mztab"))
+        cls.prot3 = parse_mztab(Path("data/F023569.pride.mztab"))
+        cls.meta = parse_metabolomics(
+            Path("data/measurements.tsv"),
+            mapping_path=Path("data/map.tsv"),
+        )
 
     def setUp(self):
         self.storage.drop()
@@ -36,29 +52,50 @@ class TestNetworkBuilder(unittest.TestCase):
         # as a concrete node ID or inside a stub’s aliases.
         ids = [ele for ele, _ in dataset.features()]
         found = {n.id for n in self.storage.find_nodes(ids=ids)}
-        stubs = self.storage.find_nodes(label=IDS.type.unknown)
-        alias_in_stubs = set()
-        for s in stubs:
-            alias_in_stubs.update(s.properties.get(IDS.predicates.alias, []))
-        missing = [i for i in ids if i not in found and i not in alias_in_stubs]
+        missing = [i for i in ids if i not in found]
+        if missing:
+            # only pull the stub nodes when some id is not a node itself
+            stubs = self.storage.find_nodes(label=IDS.type.unknown)
+            alias_in_stubs = set()
+            for s in stubs:
+                alias_in_stubs.update(s.properties.get(IDS.predicates.alias, []))
+            missing = [i for i in missing if i not in alias_in_stubs]
         self.assertFalse(missing, f"Missing identifiers: {missing}")
 
+    def _lookup_nodes(self, ids_by_label):
+        # One find_nodes round trip per label; results keyed label -> id -> node.
+        return {label: {n.id: n for n in 
+                        self.storage.find_nodes(ids=list(ids), label=label)}
+                for label, ids in ids_by_label.items()}
+
+    @staticmethod
+    def _matching(found, label, ids):
+        by_id = found.get(label, {})
+        return [by_id[i] for i in dict.fromkeys(ids) if i in by_id]
+
     def assert_groups_materialized(self, result):
         # Each alignment group must have a focal node id,
         # either merged real or a stub UNK:{gid},
         # and all group members are present as node
         # IDs or aliases on that focal.
+        groups = []
+        ids_by_label = defaultdict(set)
         for gid, nodes in result:
             r_node_types = [e.type for e in nodes]
             self.assertTrue(len(set(r_node_types)) == 1)
-            r_node_type = list(r_node_types)[0]
-            r_node_ids = list(set([e.identifier for e in nodes]))
-            s_nodes = self.storage.find_nodes(ids=r_node_ids,label=r_node_type)
+            r_node_type = r_node_types[0]
+            r_node_ids = list(dict.fromkeys(e.identifier for e in nodes))
+            groups.append((gid, r_node_type, r_node_ids))
+            ids_by_label[r_node_type].update(r_node_ids)
+            ids_by_label[IDS.type.unknown].update(f"UNK:{r}" for r in r_node_ids)
+        found = self._lookup_nodes(ids_by_label)
+
+        for gid, r_node_type, r_node_ids in groups:
+            s_nodes = self._matching(found, r_node_type, r_node_ids)
 
             if len(s_nodes) == 0:
                 uk_node_ids = [f"UNK:{r}" for r in r_node_ids]
-                s_nodes = self.storage.find_nodes(ids=uk_node_ids,
-                                                  label=IDS.type.unknown)
+                s_nodes = self._matching(found, IDS.type.unknown, uk_node_ids)
                 
                 self.assertEqual(len(s_nodes),1, f"Given {uk_node_ids}, with type {r_node_type} cant find a node. {gid}")
                 s_aliases = s_nodes[0].properties.get(IDS.predicates.alias)
@@ -75,21 +112,27 @@ class TestNetworkBuilder(unittest.TestCase):
 
     def assert_relations_projected(self, result):
         # Edges exist for every alignment edge, with confidence in $(0,1)$.
+        edges = []
+        ids_by_label = defaultdict(set)
         for g1, rel, g2, cnt in result.relationships():
             n1_types = [n.type for n in result.members(g1)]
             n2_types = [n.type for n in result.members(g2)]
             self.assertEqual(len(set(n1_types)),1)
             self.assertEqual(len(set(n2_types)),1)
-
-            n1 = self.storage.find_nodes(ids=[n.identifier for n 
-                                              in result.members(g1)],
-                                              label=n1_types[0])
-            n2 = self.storage.find_nodes(ids=[n.identifier for 
-                                              n in result.members(g2)],
-                                              label=n2_types[0])
+            n1_ids = [n.identifier for n in result.members(g1)]
+            n2_ids = [n.identifier for n in result.members(g2)]
+            edges.append((rel, n1_types[0], n1_ids, n2_types[0], n2_ids))
+            ids_by_label[n1_types[0]].update(n1_ids)
+            ids_by_label[n2_types[0]].update(n2_ids)
+            ids_by_label[IDS.type.unknown].update(f"UNK:{r}" for r in n2_ids)
+        found = self._lookup_nodes(ids_by_label)
+
+        for rel, n1_type, n1_ids, n2_type, n2_ids in edges:
+            n1 = self._matching(found, n1_type, n1_ids)
+            n2 = self._matching(found, n2_type, n2_ids)
             if len(n2) == 0:
-                uk_node_ids = [f"UNK:{r}" for r in [n.identifier for n in result.members(g2)]]
-                n2 = self.storage.find_nodes(ids=uk_node_ids,label=IDS.type.unknown)
+                uk_node_ids = [f"UNK:{r}" for r in n2_ids]
+                n2 = self._matching(found, IDS.type.unknown, uk_node_ids)
             self.assertEqual(len(n1) , 1,f'{n1}')
             self.assertEqual(len(n2) , 1,f'{n2}')
             res = self.storage.find_relationships(rel, n1[0].id, n2[0].id)
@@ -110,7 +153,7 @@ class TestNetworkBuilder(unittest.TestCase):
 
     def test_build_single_datafile(self):
         gb = OmicGraphBuilder()
-        sequence_data = parse_genbank(Path("data/sequence.gb"))
+        sequence_data = self.sequence_data
         result = match_references(sequence_data)
 
         gb.add_omic_set(sequence_data)
@@ -123,8 +166,8 @@ class TestNetworkBuilder(unittest.TestCase):
 
     def test_build_single_omic(self):
         gb = OmicGraphBuilder()
-        sequence_data = parse_genbank(Path("data/sequence.gb"))
-        gff_data = parse_gff3(Path("data/sequence.gff3"))
+        sequence_data = self.sequence_data
+        gff_data = self.gff_data
         result = match_references(sequence_data,gff_data)
 
         gb.add_omic_set(sequence_data)
@@ -139,13 +182,9 @@ class TestNetworkBuilder(unittest.TestCase):
 
     def test_build_double_omic(self):
         gb = OmicGraphBuilder()
-        sequence_data = parse_genbank(Path("data/sequence.gb"))
-        gff_data = parse_gff3(Path("data/sequence.gff3"))
-        trans_data = parse_precise2(
-            Path("data/expression_tpm_log.csv"),
-            presence_path=Path("data/gene_presence_matrix_bool.csv"),
-            metadata_path=Path("data/samples_metadata.csv"),
-        )
+        sequence_data = self.sequence_data
+        gff_data = self.gff_data
+        trans_data = self.trans_data
         result = match_references(sequence_data,gff_data,trans_data)
         gb.add_omic_set(sequence_data)
         gb.add_omic_set(gff_data)
@@ -161,20 +200,11 @@ class TestNetworkBuilder(unittest.TestCase):
 
     def test_build_all_omic(self):
         gb = OmicGraphBuilder()
-        sequence_data = parse_genbank(Path("data/sequence.gb"))
-        gff_data = parse_gff3(Path("data/sequence.gff3"))
-        trans_data = parse_precise2(
-            Path("data/expression_tpm_log.csv"),
-            presence_path=Path("data/gene_presence_matrix_bool.csv"),
-            metadata_path=Path("data/samples_metadata.csv"),
-        )
-        prot1 = parse_mztab(Path("data/F020490.pride.mztab"))
-        prot2 = parse_mztab(Path("data/F020549.pride.mztab"))
-        prot3 = parse_mztab(Path("data/F023569.pride.mztab"))
-        meta = parse_metabolomics(
-            Path("data/measurements.tsv"),
-            mapping_path=Path("data/map.tsv"),
-        )
+        sequence_data = self.sequence_data
+        gff_data = self.gff_data
+        trans_data = self.trans_data
+        prot1, prot2, prot3 = self.prot1, self.prot2, self.prot3
+        meta = self.meta
         result = match_references(sequence_data,gff_data,
                                   trans_data,prot1,
                                   prot2,prot3,meta)
@@ -10,12 +10,15 @@ def _collect_labels():
         labs.append(getattr(IDS.omics_type, f.name))
     return sorted(set(labs))
 
+# IDS is frozen, so the label set never changes
+_LABELS = tuple(_collect_labels())
+
 class NetworkBuilderConvention(DefaultConvention):
     def __init__(self):
         super().__init__()
 
     def get_constraints(self) -> dict:
-        labels = _collect_labels()
+        labels = list(_LABELS)
         return {
             "constraints": [
                 {
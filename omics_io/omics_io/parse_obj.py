@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List
 import pandas as pd
 from pandas.api.types import is_numeric_dtype
-from typing import Dict, Any, Iterator, Tuple, Optional
+from typing import Dict, Any, Iterator, NamedTuple, Tuple, Optional
 
 @dataclass(slots=True)
 class FeatureRec:
@@ -31,19 +31,14 @@ class ColumnRec:
         props["namespace"] = self.namespace
         return props
 
-@dataclass(frozen=True, slots=True)
-class CrossRef:     
+class CrossRef(NamedTuple):
+    # a plain tuple: built in C, iterates and hashes as (src, namespace, target)
     src: str         
     namespace: str
     target: str
 
     def to_tuple(self):
-        return (self.src,self.namespace,self.target)
-    
-    def __iter__(self):
-        yield self.src
-        yield self.namespace
-        yield self.target
+        return tuple(self)
 
 @dataclass(frozen=True, slots=True)
 class OmicData:
@@ -72,7 +67,8 @@ class OmicData:
         
         if m.index.has_duplicates or m.columns.has_duplicates:
             raise ValueError("Duplicate feature or column IDs")
-        if not all(is_numeric_dtype(dt) for dt in m.dtypes):
+        # wide matrices share a handful of dtypes; check each distinct one
+        if not all(is_numeric_dtype(dt) for dt in set(m.dtypes)):
             raise ValueError("matrix must be numeric-typed")
 
         fm = object.__getattribute__(self, "feature_meta")
@@ -80,7 +76,8 @@ class OmicData:
             if not isinstance(fm, list):
                 raise ValueError("feature_meta must be a list of FeatureRec")
             ids = [r.id for r in fm]
-            if list(m.index) != ids:
+            # length first, then one C-level tolist instead of iterating
+            if len(ids) != len(m.index) or m.index.tolist() != ids:
                 raise ValueError("feature_meta IDs must match matrix.index order")
 
         
@@ -89,15 +86,22 @@ class OmicData:
             if not isinstance(cm, list):
                 raise ValueError("column_meta must be a list of ColumnRec")
             ids = [r.id for r in cm]
-            if list(m.columns) != ids:
+            if len(ids) != len(m.columns) or m.columns.tolist() != ids:
                 raise ValueError("column_meta IDs must match matrix.columns order")
 
     def features(self,return_matrix=False) -> Iterator:
         fm = self.feature_meta
-        for i, fid in enumerate(self.matrix.index):
+        m = self.matrix
+        if return_matrix:
+            # one ndarray for the whole matrix; rows are wrapped as views
+            # rather than rebuilt through .iloc for every feature
+            vals = m.to_numpy()
+            cols = m.columns
+        for i, fid in enumerate(m.index):
             meta = fm[i] if fm is not None else None
             if return_matrix:
-                yield str(fid), self.matrix.iloc[i, :], meta
+                yield str(fid), pd.Series(vals[i], index=cols, name=fid,
+                                          copy=False), meta
             else:
                 yield str(fid), meta
 
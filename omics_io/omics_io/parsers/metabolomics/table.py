@@ -1,6 +1,7 @@
 from __future__ import annotations
-import io, gzip
+import io
 from typing import Optional, Dict, Any, List, Tuple
+import numpy as np
 import pandas as pd
 from ...errors import ParseError
 from ...parse_obj import OmicData, FeatureRec, ColumnRec, CrossRef
@@ -35,16 +36,21 @@ HEADER_ALIASES: Dict[str, str] = {
     "kegg": COL_KEGG,
 }
 NON_SAMPLE_COLS = {COL_METAB, COL_REFMET}
+# header canonicalisation: drop spaces, hyphens to underscores
+_HEADER_TRANS = str.maketrans({" ": None, "-": "_"})
+# alias keys normalised the same way as incoming headers
+_CANON_HEADERS: Dict[str, str] = {
+    k.lower().translate(_HEADER_TRANS): v for k, v in HEADER_ALIASES.items()
+}
 
 
 
 def _read_table(path: str, sep: str) -> pd.DataFrame:
     try:
-        if str(path).endswith(".gz"):
-            with gzip.open(path, "rt", encoding="utf-8") as fh:
-                return pd.read_csv(fh, sep=sep, dtype=str)
-        with open(path, "rt", encoding="utf-8") as fh:
-            return pd.read_csv(fh, sep=sep, dtype=str)
+        # hand pandas the path so it decompresses and buffers in C;
+        # compression follows the suffix (.gz as before, also .bz2/.zip/.xz)
+        return pd.read_csv(path, sep=sep, dtype=str, encoding="utf-8",
+                           compression="infer", memory_map=True)
     except Exception as e:
         raise ParseError(f"Failed to read table: {e}", path=path, cause=e)
 
@@ -54,9 +60,10 @@ def _normalize_headers(df: pd.DataFrame) -> pd.DataFrame:
     cols = []
     for c in df.columns:
         key = str(c).strip()
-        lc = key.lower().replace(" ", "").replace("-", "_")
-        cols.append(HEADER_ALIASES.get(lc, key))
-    out = df.copy()
+        lc = key.lower().translate(_HEADER_TRANS)
+        cols.append(_CANON_HEADERS.get(lc, key))
+    # relabel a shallow copy; the cell data is shared, not duplicated
+    out = df.copy(deep=False)
     out.columns = cols
     return out
 
@@ -73,8 +80,9 @@ def _pick_feature_name(df: pd.DataFrame) -> Tuple[pd.Series, str]:
             raise ParseError(f"Missing required column '{COL_METAB}'")
         s, ns = df[COL_METAB], NS_METAB
     s = s.astype(str).str.strip()
-    if s.duplicated().any():
-        dups = s[s.duplicated()].unique()[:5]
+    dup = s.duplicated()
+    if dup.any():
+        dups = s[dup].unique()[:5]
         raise ParseError(f"Duplicate feature IDs after naming: {list(dups)}")
     s.name = "feature_id"
     return s, ns
@@ -91,18 +99,27 @@ def _extract_sample_meta(
     sample_meta = None
     df = raw
     if factor_mask.any():
-        frow = raw.loc[factor_mask].iloc[0]
-        records: Dict[str, Dict[str, str]] = {str(c): {} for c in sample_cols}
-        for c in sample_cols:
-            val = str(frow.get(c, "")).strip()
-            if ":" in val:
-                k, v = val.split(":", 1)
-                k, v = k.strip(), v.strip()
-                if k and v:
-                    records[str(c)][k] = v
-            elif val:
-                records[str(c)]["factor"] = val
-        sample_meta = pd.DataFrame.from_dict(records, orient="index")
+        frow = raw.loc[factor_mask, sample_cols].iloc[0]
+        vals = frow.astype(str).str.strip()
+        vals.index = pd.Index([str(c) for c in sample_cols])
+        # "key: value" cells become that key; other non-empty cells "factor"
+        parts = vals.str.split(":", n=1, expand=True)
+        if parts.shape[1] == 2:
+            has_sep = parts[1].notna()
+            k, v = parts[0].str.strip(), parts[1].str.strip()
+            keys = k.where(has_sep & k.ne("") & v.ne(""))
+            values = v.where(keys.notna())
+        else:
+            has_sep = pd.Series(False, index=vals.index)
+            keys = values = pd.Series(None, index=vals.index, dtype=object)
+        plain = ~has_sep & vals.ne("")
+        keys = keys.mask(plain, "factor")
+        values = values.mask(plain, vals)
+        tagged = keys.notna()
+        keys, values = keys[tagged], values[tagged]
+        sample_meta = pd.DataFrame(index=keys.index)
+        for key in keys.unique():
+            sample_meta[key] = values.where(keys.eq(key))
         df = raw.loc[~factor_mask].reset_index(drop=True)
     return df, sample_meta, sample_cols
 
@@ -110,15 +127,17 @@ def _extract_sample_meta(
 def _build_matrix(
     df: pd.DataFrame, sample_cols: List[str], chosen_ids: pd.Series
 ) -> pd.DataFrame:
-    df = df.copy()
-    df.index = chosen_ids
-    drop_cols = [c for c in (COL_METAB, COL_REFMET) if c in df.columns]
-    df = df.drop(columns=drop_cols)
+    # select the sample columns directly (they never include the name
+    # columns) instead of copying and dropping from the whole table
     keep = [c for c in sample_cols if c in df.columns]
-    mat = df[keep].apply(pd.to_numeric, errors="coerce")
-    mat.index = mat.index.astype(str)
-    mat.columns = pd.Index([str(c) for c in mat.columns], name="sample")
-    return mat
+    # one to_numeric pass over every cell rather than one per column
+    arr = df[keep].to_numpy(dtype=object)
+    flat = pd.to_numeric(arr.ravel(), errors="coerce")
+    return pd.DataFrame(
+        np.asarray(flat, dtype=float).reshape(arr.shape),
+        index=pd.Index(chosen_ids).astype(str),
+        columns=pd.Index([str(c) for c in keep], name="sample"),
+    )
 
 
 
@@ -135,20 +154,24 @@ def _load_mapping(mapping_path: Optional[str], sep: str) -> Optional[pd.DataFram
     return m
 
 
-def _build_id_lookup(mapping: pd.DataFrame) -> Dict[Tuple[str, str], Dict[str, str]]:
+def _build_id_lookup(mapping: pd.DataFrame) -> Dict[Tuple[str, str], pd.Series]:
     def _norm(s: pd.Series) -> pd.Series:
         return s.astype(str).str.strip().str.lower()
 
-    lookups: Dict[Tuple[str, str], Dict[str, str]] = {}
+    def _lookup(keys: pd.Series, col: str) -> pd.Series:
+        # key -> target Series usable directly with .map; a repeated key
+        # keeps its last target, as dict(zip(...)) did
+        s = pd.Series(mapping[col].astype(str).to_numpy(), index=keys.to_numpy())
+        return s[~s.index.duplicated(keep="last")]
+
+    lookups: Dict[Tuple[str, str], pd.Series] = {}
     for key_col in (COL_REFMET, COL_METAB):
         if key_col in mapping.columns:
             k = _norm(mapping[key_col])
             if COL_WB in mapping.columns:
-                lookups[(key_col, COL_WB)] = dict(zip(k, mapping[COL_WB].astype(str)))
+                lookups[(key_col, COL_WB)] = _lookup(k, COL_WB)
             if COL_KEGG in mapping.columns:
-                lookups[(key_col, COL_KEGG)] = dict(
-                    zip(k, mapping[COL_KEGG].astype(str))
-                )
+                lookups[(key_col, COL_KEGG)] = _lookup(k, COL_KEGG)
     return lookups
 
 
@@ -161,66 +184,68 @@ def _emit_external_refs(
     def _norm(s: pd.Series) -> pd.Series:
         return s.astype(str).str.strip().str.lower()
 
-    keys_cols = [c for c in (COL_METAB, COL_REFMET) if c in raw_keys.columns]
-    keys = raw_keys[keys_cols].copy()
-    keys.index = chosen_ids.astype(str)
-    keys = keys.loc[chosen_ids.astype(str)]
+    # work on the key columns in place; rows line up with chosen_ids
+    accs = chosen_ids.astype(str).tolist()
     lookups = _build_id_lookup(mapping)
     key_ref = (
-        _norm(keys[COL_REFMET])
-        if COL_REFMET in keys.columns
-        else pd.Series(index=keys.index, dtype=str)
+        _norm(raw_keys[COL_REFMET]) if COL_REFMET in raw_keys.columns else None
     )
     key_met = (
-        _norm(keys[COL_METAB])
-        if COL_METAB in keys.columns
-        else pd.Series(index=keys.index, dtype=str)
+        _norm(raw_keys[COL_METAB]) if COL_METAB in raw_keys.columns else None
     )
-    ids = pd.DataFrame(index=keys.index)
+    found: List[List[str]] = []
     for col in (COL_WB, COL_KEGG):
-        s = pd.Series(index=keys.index, dtype=object)
-        if (COL_REFMET, col) in lookups:
+        s = pd.Series(index=raw_keys.index, dtype=object)
+        if key_ref is not None and (COL_REFMET, col) in lookups:
             s = key_ref.map(lookups[(COL_REFMET, col)])
-        if (COL_METAB, col) in lookups:
+        if key_met is not None and (COL_METAB, col) in lookups:
             s = s.combine_first(key_met.map(lookups[(COL_METAB, col)]))
-        ids[col] = s
+        found.append(s.fillna("").astype(str).str.strip().tolist())
     xrefs: List[CrossRef] = []
-    for acc, row in ids.fillna("").iterrows():
-        wb = str(row.get(COL_WB, "")).strip()
-        kg = str(row.get(COL_KEGG, "")).strip()
+    for acc, wb, kg in zip(accs, *found):
         if wb:
-            xrefs.append(CrossRef(str(acc), NS_WB, wb))
+            xrefs.append(CrossRef(acc, NS_WB, wb))
         if kg:
-            xrefs.append(CrossRef(str(acc), NS_KEGG, kg))
+            xrefs.append(CrossRef(acc, NS_KEGG, kg))
     return xrefs
 
 
 
 def _build_feature_meta(mat: pd.DataFrame, chosen_ns: str) -> List[FeatureRec]:
     ns = NS_REFMET if chosen_ns == NS_REFMET else NS_METAB
+    entity = IDS.type.metabolite
     return [
-        FeatureRec(id=str(fid), entity=IDS.type.metabolite, namespace=ns, attrs={})
-        for fid in mat.index
+        FeatureRec(fid, entity, ns, {})
+        for fid in mat.index.astype(str).tolist()
     ]
 
 
-def _build_column_meta(
+def _stack_sample_meta(
     mat: pd.DataFrame, sample_meta: Optional[pd.DataFrame]
+) -> Optional[pd.Series]:
+    """Long-form ``(sample, key) -> value`` metadata for the matrix columns."""
+    if sample_meta is None:
+        return None
+    # in sample then key order; dropna as pandas 3's stack keeps NaN
+    return sample_meta.reindex(mat.columns).stack().dropna()
+
+
+def _build_column_meta(
+    mat: pd.DataFrame, long_meta: Optional[pd.Series]
 ) -> List[ColumnRec]:
+    attrs_by_sid: Dict[Any, Dict[str, str]] = {}
+    if long_meta is not None:
+        for (sid, k), v in long_meta.items():
+            attrs_by_sid.setdefault(sid, {})[str(k)] = str(v)
     col_meta: List[ColumnRec] = []
-    if sample_meta is not None:
-        sample_meta = sample_meta.reindex(mat.columns)
     for sid in mat.columns:
-        attrs = {}
-        if sample_meta is not None and sid in sample_meta.index:
-            attrs = {str(k): str(v) for k, v in sample_meta.loc[sid].dropna().items()}
         col_meta.append(
             ColumnRec(
                 id=str(sid),
                 entity=IDS.type.sample,
                 namespace=IDS.ns.SampleID,
                 role="sample",
-                attrs=attrs,
+                attrs=attrs_by_sid.get(sid, {}),
             )
         )
     return col_meta
@@ -230,16 +255,16 @@ def _build_cross_refs(
     mat: pd.DataFrame,
     chosen_ns: str,
     external: List[CrossRef],
-    sample_meta: Optional[pd.DataFrame] = None,
+    long_meta: Optional[pd.Series] = None,
 ) -> List[CrossRef]:
-    x: List[CrossRef] = [CrossRef(str(fid), chosen_ns, str(fid)) for fid in mat.index]
+    x: List[CrossRef] = [
+        CrossRef(fid, chosen_ns, fid) for fid in mat.index.astype(str).tolist()
+    ]
     x.extend(external)
-    if sample_meta is not None and not sample_meta.empty:
-        sample_meta = sample_meta.reindex(mat.columns)
-        for sid in mat.columns:
-            if sid in sample_meta.index:
-                for k, v in sample_meta.loc[sid].dropna().items():
-                    x.append(CrossRef(str(sid), str(k), str(v)))
+    if long_meta is not None:
+        x.extend(
+            CrossRef(str(sid), str(k), str(v)) for (sid, k), v in long_meta.items()
+        )
     return x
 
 
@@ -270,8 +295,9 @@ def parse_metabolomics(
     external_refs = _emit_external_refs(df, chosen_ids, mapping)
 
     feature_meta = _build_feature_meta(mat, chosen_ns)
-    column_meta  = _build_column_meta(mat, sample_meta)
-    cross_ref    = _build_cross_refs(mat, chosen_ns, external_refs, sample_meta)
+    long_meta    = _stack_sample_meta(mat, sample_meta)
+    column_meta  = _build_column_meta(mat, long_meta)
+    cross_ref    = _build_cross_refs(mat, chosen_ns, external_refs, long_meta)
 
     return OmicData(
         name="metabolomics_matrix",
@@ -1,62 +1,62 @@
 from __future__ import annotations
-import re, gzip, io
+import re, gzip
 from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 from pyteomics import mztab
 from ...parse_obj import OmicData, FeatureRec, ColumnRec, CrossRef
 from ...errors import ParseError
 from ...identifiers import IDS
 
-_RUN_COL_PATS = (
-    r"(best_search_engine_score\[\d+\])_ms_run\[(\d+)\]",
-    r"(num_psms)_ms_run\[(\d+)\]",
-    r"(num_peptides_(?:distinct|unique))_ms_run\[(\d+)\]",
-)
-_ABUND_PATS = (
-    r"abundance_assay\[(\d+)\]",
-    r"sub\[\d+\]_abundance_assay\[(\d+)\]",
+# one alternation per column family, so each column is scanned once
+_RUN_COL_RE = re.compile(
+    r"(?P<metric>best_search_engine_score\[\d+\]|num_psms"
+    r"|num_peptides_(?:distinct|unique))_ms_run\[(?P<run>\d+)\]"
 )
+_ABUND_RE = re.compile(r"(?:sub\[\d+\]_)?abundance_assay\[(?P<assay>\d+)\]")
 _GN_RE = re.compile(r"\bGN=([A-Za-z0-9_.-]+)\b")
+
+# IDS constants used per protein row
+ENT_PROTEIN = IDS.type.protein
+NS_UNIPROT = IDS.ns.UniProtKB
+P_ALIAS = IDS.predicates.alias
+P_PRODUCED_BY = IDS.predicates.produced_by
+P_CONTAINS = IDS.predicates.contains
+P_MODIFICATION = IDS.predicates.modification
+P_PART_OF = IDS.predicates.part_of
 _ASSAY_NAME_RE = re.compile(r"assay\[(\d+)\]-name$")
+_DECOY_PREFIXES = ("DECOY_", "XXX_", "REV__", "CON__")
+_UNIMOD_RE = re.compile(r"UNIMOD:\d+")
 
 
 def _open_mztab(path: str) -> mztab.MzTab:
     """Open .mzTab or .mzTab.gz safely and return a parsed MzTab object."""
     try:
-        if str(path).endswith(".gz"):
-            with gzip.open(path, "rt", encoding="utf-8") as fh:
-                text = fh.read()
-        else:
-            with open(path, "rt", encoding="utf-8") as fh:
-                text = fh.read()
-        return mztab.MzTab(io.StringIO(text))
+        opener = gzip.open if str(path).endswith(".gz") else open
+        # MzTab iterates the handle line by line; no whole-file copy
+        with opener(path, "rt", encoding="utf-8") as fh:
+            return mztab.MzTab(fh)
     except Exception as e:
         raise ParseError(f"mzTab open failed: {e}", path=str(path), cause=e)
     
 
-def _is_decoy(acc: str) -> bool:
-    return bool(re.match(r"^(DECOY_|XXX_|REV__|CON__)", str(acc)))
-
-
 def _rename_run_cols(cols: List[str]) -> Dict[str, str]:
     out = {}
+    match = _RUN_COL_RE.fullmatch
     for c in cols:
-        for pat in _RUN_COL_PATS:
-            m = re.fullmatch(pat, c)
-            if m:
-                out[c] = f"{m.group(1)}_run{m.group(2)}"
-                break
+        m = match(c)
+        if m:
+            out[c] = f"{m['metric']}_run{m['run']}"
     return out
 
 
 def _list_assay_cols(cols: List[str]) -> List[Tuple[str, str]]:
     out = []
+    match = _ABUND_RE.fullmatch
     for c in cols:
-        for pat in _ABUND_PATS:
-            m = re.fullmatch(pat, c)
-            if m:
-                out.append((c, m.group(1)))
-                break
+        m = match(c)
+        if m:
+            out.append((c, m['assay']))
     return out
 
 
@@ -84,15 +84,20 @@ def _normalize_protein_table(
     ptab["accession"] = ptab["accession"].astype(str)
     ptab = ptab.set_index("accession", drop=True)
     if filter_decoys:
-        ptab = ptab[~ptab.index.map(_is_decoy)]
+        # accessions are str here; a plain prefix test, no regex needed
+        ptab = ptab[~ptab.index.str.startswith(_DECOY_PREFIXES)]
 
-    def _ok(row: pd.Series) -> bool:
-        npsm = int(row.get("num_psms") or 0)
-        nuni = int(row.get("num_peptides_unique") or 0)
-        return (npsm >= min_psms) and (nuni >= min_unique)
+    def _counts(col: str) -> pd.Series:
+        # missing column or unparsable cell counts as 0
+        if col not in ptab.columns:
+            return pd.Series(0, index=ptab.index)
+        return pd.to_numeric(ptab[col], errors="coerce").fillna(0)
 
     if min_psms or min_unique:
-        ptab = ptab[ptab.apply(_ok, axis=1)]
+        ok = (_counts("num_psms") >= min_psms) & (
+            _counts("num_peptides_unique") >= min_unique
+        )
+        ptab = ptab[ok]
     return ptab
 
 
@@ -102,9 +107,23 @@ def _select_matrix(
     assay_cols = _list_assay_cols(list(ptab.columns)) if not ptab.empty else []
     if prefer_quant and mztab_type.lower().startswith("quant") and assay_cols:
         cols, assays = zip(*assay_cols)
-        mat = ptab.loc[:, list(cols)].copy()
-        mat.columns = [f"assay_{a}" for a in assays]
-        return mat.apply(pd.to_numeric, errors="coerce")
+        mat = ptab.loc[:, list(cols)]
+        columns = [f"assay_{a}" for a in assays]
+        if all(pd.api.types.is_numeric_dtype(dt) for dt in set(mat.dtypes)):
+            # pyteomics has usually cast the abundances already
+            return pd.DataFrame(
+                mat.to_numpy(dtype=np.float64, na_value=np.nan),
+                index=mat.index,
+                columns=columns,
+            )
+        # one to_numeric pass over every cell rather than one per column
+        arr = mat.to_numpy(dtype=object)
+        flat = pd.to_numeric(arr.ravel(), errors="coerce")
+        return pd.DataFrame(
+            np.asarray(flat, dtype=np.float64).reshape(arr.shape),
+            index=mat.index,
+            columns=columns,
+        )
 
     prefer_cols = [
         c
@@ -124,54 +143,60 @@ def _select_matrix(
         if c in ptab.columns
     ]
     keep = prefer_cols or fallback
-    matrix = ptab.loc[:, keep].copy() if keep else pd.DataFrame(index=ptab.index)
-    for c in matrix.columns:
-        matrix[c] = pd.to_numeric(matrix[c], errors="ignore")
-    return matrix
+    matrix = ptab.loc[:, keep] if keep else pd.DataFrame(index=ptab.index)
+    # coerce column by column: apply() never calls the function on an empty
+    # frame, which would leave all-null object columns non-numeric
+    return pd.DataFrame(
+        {c: pd.to_numeric(matrix[c], errors="coerce") for c in matrix.columns},
+        index=matrix.index,
+    )
 
 
 def _build_feature_meta_and_xrefs(
     ptab: pd.DataFrame,
 ) -> Tuple[List[FeatureRec], List[CrossRef]]:
-    desc = ptab.get("description", pd.Series(index=ptab.index, dtype=object))
-    amb = ptab.get("ambiguity_members", pd.Series(index=ptab.index, dtype=object))
-    mods = ptab.get("modifications", pd.Series(index=ptab.index, dtype=object))
-    taxs = ptab.get("taxid", pd.Series(index=ptab.index, dtype=object))
+    accs = ptab.index.tolist()
 
-    feats: List[FeatureRec] = []
+    def _col(name: str) -> List[Any]:
+        # whole column as a list, read in step with accs
+        return ptab[name].tolist() if name in ptab.columns else [None] * len(accs)
+
+    feats: List[FeatureRec] = [
+        FeatureRec(acc, ENT_PROTEIN, NS_UNIPROT, {}) for acc in accs
+    ]
     xrefs: List[CrossRef] = []
-    for acc in ptab.index:
-        feats.append(
-            FeatureRec(id=acc, entity=IDS.type.protein, namespace=IDS.ns.UniProtKB)
-        )
-        xrefs.append(CrossRef(acc, IDS.predicates.alias, acc))
-        g = _gene_from_desc(desc.get(acc))
+    for acc, desc_v, amb_v, mod_v, tax_v in zip(
+        accs,
+        _col("description"),
+        _col("ambiguity_members"),
+        _col("modifications"),
+        _col("taxid"),
+    ):
+        xrefs.append(CrossRef(acc, P_ALIAS, acc))
+        g = _gene_from_desc(desc_v)
         if g:
-            xrefs.append(CrossRef(acc, IDS.predicates.produced_by, g))
-        amb_v = amb.get(acc)
-        if isinstance(amb_v, str) and amb_v.strip() and str(amb_v).lower() != "null":
-            for member in str(amb_v).split(","):
+            xrefs.append(CrossRef(acc, P_PRODUCED_BY, g))
+        if isinstance(amb_v, str) and amb_v.strip() and amb_v.lower() != "null":
+            for member in amb_v.split(","):
                 if member.strip():
                     xrefs.append(
-                        CrossRef(acc, IDS.predicates.contains, member.strip()
+                        CrossRef(acc, P_CONTAINS, member.strip()
                         )
                     )
-        mod_v = mods.get(acc)
-        if isinstance(mod_v, str) and mod_v.strip() and str(mod_v).lower() != "null":
-            for tok in str(mod_v).split(","):
-                m = re.search(r"UNIMOD:\d+", tok)
-                if m:
-                    xrefs.append(CrossRef(acc, IDS.predicates.modification, m.group(0)))
-        tax_v = taxs.get(acc)
+        if isinstance(mod_v, str) and mod_v.strip() and mod_v.lower() != "null":
+            # one scan of the whole field; ids never span the "," separators
+            for uid in _UNIMOD_RE.findall(mod_v):
+                xrefs.append(CrossRef(acc, P_MODIFICATION, uid))
         if pd.notna(tax_v):
-            xrefs.append(CrossRef(acc, IDS.predicates.part_of, str(tax_v)))
+            xrefs.append(CrossRef(acc, P_PART_OF, str(tax_v)))
     return feats, xrefs
 
 
 def _parse_md_assays(md: Dict[str, Any]) -> Dict[str, str]:
     names = {}
+    search_name = _ASSAY_NAME_RE.search
     for k, v in (md or {}).items():
-        m = _ASSAY_NAME_RE.search(str(k))
+        m = search_name(str(k))
         if m:
             names[m.group(1)] = str(v)
     return names
@@ -222,7 +247,6 @@ def parse_mztab(
     matrix = _select_matrix(
         ptab, mztab_type=str(md.get("mzTab-type", "")), prefer_quant=prefer_quant
     )
-    matrix = matrix.apply(pd.to_numeric, errors="coerce")
 
     feats, feat_xrefs = _build_feature_meta_and_xrefs(ptab)
     assay_cols = _list_assay_cols(list(ptab.columns))
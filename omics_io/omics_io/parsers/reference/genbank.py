@@ -1,12 +1,26 @@
 from __future__ import annotations
+import io
+import re
+import sys
 from dataclasses import asdict
 from typing import Dict, Any, List, Tuple, Iterable, Optional
 import pandas as pd
 from ...errors import ParseError
 from ...parse_obj import OmicData, FeatureRec, CrossRef
 from ...identifiers import IDS
-from ...utils import to_primitive
-from Bio import SeqIO
+from Bio.GenBank import _FeatureConsumer
+from Bio.GenBank.Scanner import GenBankScanner
+
+try:
+    import rapidgzip
+except ImportError:  # rapidgzip is optional; .gz falls back to gzip
+    rapidgzip = None
+
+VALID_ENTITIES = frozenset(asdict(IDS.type).values())
+ENT_DNA = IDS.type.dna
+NS_LOCUS = IDS.ns.RefSeq_Locus
+# a plain (optionally fuzzy-ended) range, possibly complemented
+_SPAN_RE = re.compile(r"(complement\()?<?(\d+)\.\.>?(\d+)(?(1)\))")
 
 
 def _q(q: dict, key: str) -> str | None:
@@ -22,43 +36,132 @@ def _is_missing(x) -> bool:
 
 def _open_text(path: str):
     if str(path).endswith(".gz"):
+        if rapidgzip is not None:
+            # parallel decompression; 0 = use every available core
+            raw = rapidgzip.open(str(path), parallelization=0)
+            return io.TextIOWrapper(io.BufferedReader(raw))
         import gzip
 
         return gzip.open(path, "rt")
     return open(path, "rt")
 
 
+class _FeatureOnlyScanner(GenBankScanner):
+    """``GenBankScanner`` that reads past the sequence instead of keeping it.
+
+    Only the feature table is used here. The ORIGIN block is usually most of
+    the file, so its lines are skipped rather than collected and joined;
+    records come back with an undefined sequence of the LOCUS length. The
+    feature table is kept as the scanner's raw tuples, so no ``SeqFeature``
+    is built for the many features that are filtered out.
+    """
+
+    def parse_footer(self):
+        if self.line[: self.HEADER_WIDTH].rstrip() not in self.SEQUENCE_HEADERS:
+            raise ValueError(f"Footer format unexpected:  '{self.line}'")
+
+        misc_lines = []
+        while (
+            self.line[: self.HEADER_WIDTH].rstrip() in self.SEQUENCE_HEADERS
+            or self.line[: self.HEADER_WIDTH] == " " * self.HEADER_WIDTH
+            or "WGS" == self.line[:3]
+        ):
+            misc_lines.append(self.line.rstrip())
+            self.line = self.handle.readline()
+            if not self.line:
+                raise ValueError("Premature end of file")
+
+        line = self.line
+        while line and not line.startswith(("//", "CONTIG")):
+            line = self.handle.readline()
+        self.line = line.rstrip() if line else "//"
+        return misc_lines, ""
+
+    @staticmethod
+    def _feed_feature_table(consumer, feature_tuples):
+        # keep the raw (key, location, qualifiers) tuples; no SeqFeature or
+        # location objects are built for features that are filtered out
+        consumer.feature_table = feature_tuples
+
+    def parse_tables(self, handle):
+        """Yield one ``_TableConsumer`` per record in ``handle``."""
+        while True:
+            table = _TableConsumer(use_fuzziness=1)
+            if not self.feed(handle, table):
+                return
+            if table.data.id is None or table.data.name == "<unknown name>":
+                raise ValueError("Failed to parse the record's ID. Invalid ID line?")
+            yield table
+
+
+class _TableConsumer(_FeatureConsumer):
+    """Record header plus the feature table as the scanner's raw tuples."""
+
+    # (key, location string, [(qualifier, raw value or None), ...])
+    feature_table: List[Tuple[str, str, List[Tuple[str, Optional[str]]]]] = ()
+
+    def span(self, location: str) -> Tuple[int, int, int]:
+        """1-based ``(start, end, strand)`` of a feature location string."""
+        m = _SPAN_RE.fullmatch(location)
+        if m is not None:
+            start, end = int(m[2]), int(m[3])
+            if 0 < start <= end:
+                if m[1]:
+                    return start, end, -1
+                return start, end, 0 if "PROTEIN" in self._seq_type.upper() else 1
+        # joins, origin-spanning and other forms go through Biopython
+        self.feature_key("")
+        self.location(location)
+        loc = self._cur_feature.location
+        return int(loc.start) + 1, int(loc.end), int(loc.strand or 0)
+
+
+def _qualifiers(pairs: List[Tuple[str, Optional[str]]]) -> Dict[str, List[str]]:
+    """Qualifier values as Biopython's feature consumer stores them."""
+    q: Dict[str, List[str]] = {}
+    for key, value in pairs:
+        if value is None:
+            # valueless flags such as /pseudo
+            q.setdefault(key, [""])
+            continue
+        value = value.replace("\n", " ")
+        if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+            value = value[1:-1]
+        q.setdefault(key, []).append(value.replace('""', '"'))
+    return q
+
+
 def _iter_genbank(path: str):
     with _open_text(path) as fh:
-        for rec in SeqIO.parse(fh, "genbank"):
-            yield rec
+        yield from _FeatureOnlyScanner(debug=0).parse_tables(fh)
 
 
 def _parse_record(
-    rec, keep_types: set[str], include_pseudogenes: bool
+    table: _TableConsumer, keep_types: set[str], include_pseudogenes: bool
 ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str, str, str]]]:
     """Return merged feature rows and cross-ref rows for one record."""
+    rec = table.data
     contig = (getattr(rec, "id", "") or getattr(rec, "name", "")).split(".", 1)[0]
     merged: Dict[str, Dict[str, Any]] = {}
     cr_rows: List[Tuple[str, str, str, str]] = []
     cr_seen: set[Tuple[str, str, str]] = set()
 
-    for feat in rec.features:
-        ftype = str(getattr(feat, "type", "")).lower()
+    for key, location, pairs in table.feature_table:
+        ftype = key.lower()
         if ftype not in keep_types:
             continue
 
-        q = feat.qualifiers or {}
+        q = _qualifiers(pairs)
         if not include_pseudogenes and ("pseudo" in q or _q(q, "pseudogene")):
             continue
 
         locus = _q(q, "locus_tag")
         if not locus:
             continue
+        # one shared str per locus across its gene/CDS rows and cross-refs
+        locus = sys.intern(locus)
 
-        start = int(feat.location.start) + 1
-        end = int(feat.location.end)
-        strand = int(getattr(feat.location, "strand", 0) or 0)
+        start, end, strand = table.span(location)
 
         row = {
             "locus_tag": locus,
@@ -125,22 +228,19 @@ def _build_feature_meta(rows: List[Dict[str, Any]]) -> List[FeatureRec]:
         for c in ("product", "type", "contig", "start", "end", "strand")
         if c in df.columns
     ]
+    # box each column once; the nullable string/Int columns come out as
+    # Python str/int with None for NA, so cells need no further conversion
+    cols = [df[c].to_numpy(dtype=object, na_value=None) for c in keep]
     recs: List[FeatureRec] = []
-    for fid, *vals in df[keep].itertuples(name=None):
-        attrs = {k: to_primitive(v) for k, v in zip(keep, vals)}
-
-        valid_entities = set(asdict(IDS.type).values())
+    for fid, vals in zip(df.index.tolist(), zip(*cols)):
+        attrs = dict(zip(keep, vals))
         etype = str(attrs.pop("type", "")).lower()
 
-        if etype in valid_entities:
+        if etype in VALID_ENTITIES:
             e_type = etype
         else:
-            e_type = IDS.type.dna
-        recs.append(
-            FeatureRec(
-                id=str(fid), entity=e_type, namespace=IDS.ns.RefSeq_Locus, attrs=attrs
-            )
-        )
+            e_type = ENT_DNA
+        recs.append(FeatureRec(str(fid), e_type, NS_LOCUS, attrs))
     return recs
 
 
@@ -175,8 +275,8 @@ def parse_genbank(path: str, *, include_pseudogenes: bool = False) -> OmicData:
     all_cr: List[Tuple[str, str, str, str]] = []
 
     try:
-        for rec in _iter_genbank(path):
-            rows, cr_rows = _parse_record(rec, keep_types, include_pseudogenes)
+        for table in _iter_genbank(path):
+            rows, cr_rows = _parse_record(table, keep_types, include_pseudogenes)
             all_rows.extend(rows)
             all_cr.extend(cr_rows)
     except Exception as e:
@@ -1,16 +1,29 @@
 from __future__ import annotations
+import io
+import sys
 from dataclasses import asdict
 from typing import Dict, Any, List, Tuple, Iterable, Optional
 import pandas as pd
 from ...errors import ParseError
 from ...parse_obj import OmicData, FeatureRec, CrossRef
 from ...identifiers import IDS
-from ...utils import to_primitive
+
+try:
+    import rapidgzip
+except ImportError:  # rapidgzip is optional; .gz falls back to gzip
+    rapidgzip = None
 
 KEEP_TYPES = {"cds", "gene", "trna", "rrna", "ncrna", "misc_rna"}
+VALID_ENTITIES = frozenset(asdict(IDS.type).values())
+ENT_DNA = IDS.type.dna
+NS_LOCUS = IDS.ns.RefSeq_Locus
 
 def _open_text(path: str):
     if str(path).endswith(".gz"):
+        if rapidgzip is not None:
+            # parallel decompression; 0 = use every available core
+            raw = rapidgzip.open(str(path), parallelization=0)
+            return io.TextIOWrapper(io.BufferedReader(raw))
         import gzip
         return gzip.open(path, "rt")
     return open(path, "rt")
@@ -67,22 +80,16 @@ def _build_feature_meta(rows: List[Dict[str, Any]]) -> List[FeatureRec]:
         df["strand"] = pd.to_numeric(df["strand"], errors="coerce").astype("Int8")
 
     keep = [c for c in ("product", "type", "contig", "start", "end", "strand") if c in df.columns]
+    # box each column once; the nullable string/Int columns come out as
+    # Python str/int with None for NA, so cells need no further conversion
+    cols = [df[c].to_numpy(dtype=object, na_value=None) for c in keep]
     recs: List[FeatureRec] = []
 
-    valid_entities = set(asdict(IDS.type).values())
-
-    for fid, *vals in df[keep].itertuples(name=None):
-        attrs = {k: to_primitive(v) for k, v in zip(keep, vals)}
+    for fid, vals in zip(df.index.tolist(), zip(*cols)):
+        attrs = dict(zip(keep, vals))
         etype = str(attrs.pop("type", "")).lower()
-        entity = etype if etype in valid_entities else IDS.type.dna
-        recs.append(
-            FeatureRec(
-                id=str(fid),
-                entity=entity,
-                namespace=IDS.ns.RefSeq_Locus,
-                attrs=attrs,
-            )
-        )
+        entity = etype if etype in VALID_ENTITIES else ENT_DNA
+        recs.append(FeatureRec(str(fid), entity, NS_LOCUS, attrs))
     return recs
 
 def _build_cross_ref(
@@ -97,7 +104,7 @@ def _build_cross_ref(
             continue
         if axis == "feature" and str(src) not in valid:
             continue
-        out.append(CrossRef(src=str(src), namespace=str(ns), target=str(tgt)))
+        out.append(CrossRef(str(src), str(ns), str(tgt)))
     return out
 
 def _safe_alias(k: str, v: str, qa: Dict[str, str], prefix: str = "cds:") -> str:
@@ -125,38 +132,36 @@ def parse_gff3(path: str) -> OmicData:
                    plus product_label only if product exists
     """
     merged: Dict[str, Dict[str, Any]] = {}
-    ivals: Dict[str, Dict[str, Any]] = {}
     cr_rows: List[Tuple[str, str, str, str]] = []
-
-    def _update_interval(locus: str, contig: str, start_i: int, end_i: int, strand_i: int, ftype_l: str) -> None:
-        cur = ivals.get(locus)
-        if cur is None:
-            ivals[locus] = {"contig": contig, "start": start_i, "end": end_i, "strand": strand_i, "type": ftype_l}
-            return
-        if cur["contig"] == contig:
-            cur["start"] = min(cur["start"], start_i)
-            cur["end"] = max(cur["end"], end_i)
-            cur["strand"] = strand_i if cur["strand"] == strand_i else 0
+    cr_seen: set[Tuple[str, str, str]] = set()
 
     with _open_text(path) as fh:
         for line in fh:
-            if not line.strip() or line.startswith("#"):
+            if line.startswith("#"):
+                continue
+            # split off just the type column first: unkept lines (exons,
+            # regions, ...) are dropped without tokenising the attributes;
+            # blank and short lines fail the same test
+            head = line.split("\t", 3)
+            if len(head) < 4:
+                continue
+            ftype_l = head[2].lower()
+            if ftype_l not in KEEP_TYPES:
                 continue
             parts = line.rstrip("\n").split("\t")
             if len(parts) != 9:
                 continue
 
             seqid, source, ftype, start, end, score, strand, phase, attrs = parts
-            ftype_l = str(ftype).lower()
-            if ftype_l not in KEEP_TYPES:
-                continue
 
             qa = _parse_attrs(attrs)
             locus = qa.get("locus_tag", "")
             if not locus:
                 continue
+            # one shared str per locus/contig across lines, rows and cross-refs
+            locus = sys.intern(locus)
 
-            contig = seqid.split(".", 1)[0]
+            contig = sys.intern(seqid.split(".", 1)[0])
             start_i = int(start)
             end_i = int(end)
             strand_i = 1 if strand == "+" else (-1 if strand == "-" else 0)
@@ -170,44 +175,46 @@ def parse_gff3(path: str) -> OmicData:
                 "end": end_i,
                 "strand": strand_i,
             }
-            if locus not in merged:
+            cur = merged.get(locus)
+            if cur is None:
                 merged[locus] = row
             else:
-                if _is_missing(merged[locus].get("product")) and not _is_missing(row.get("product")):
-                    merged[locus]["product"] = row.get("product", "")
-                if _is_missing(merged[locus].get("type")) and not _is_missing(row.get("type")):
-                    merged[locus]["type"] = row.get("type")
-
-            _update_interval(locus, contig, start_i, end_i, strand_i, ftype_l)
+                if _is_missing(cur.get("product")) and not _is_missing(row.get("product")):
+                    cur["product"] = row.get("product", "")
+                if _is_missing(cur.get("type")) and not _is_missing(row.get("type")):
+                    cur["type"] = row.get("type")
+                # widen the interval over lines on the locus' first contig;
+                # the strand survives only if all of those lines agree
+                if cur["contig"] == contig:
+                    if start_i < cur["start"]:
+                        cur["start"] = start_i
+                    if end_i > cur["end"]:
+                        cur["end"] = end_i
+                    if cur["strand"] != strand_i:
+                        cur["strand"] = 0
 
             for ns_key in ("ID", "Parent", "locus_tag", "gene", "protein_id", "Name"):
                 val = qa.get(ns_key, "")
                 val = _safe_alias(ns_key, val, qa, prefix="cds:")
                 if val:
-                    cr_rows.append(("feature", locus, ns_key, val))
+                    # gene and CDS lines repeat the same ids; emit each once
+                    trip = (locus, ns_key, val)
+                    if trip not in cr_seen:
+                        cr_seen.add(trip)
+                        cr_rows.append(("feature", locus, ns_key, val))
 
             for ns, target in _iter_dbxref(qa.get("Dbxref", "")):
-                cr_rows.append(("feature", locus, ns, target))
+                trip = (locus, ns, target)
+                if trip not in cr_seen:
+                    cr_seen.add(trip)
+                    cr_rows.append(("feature", locus, ns, target))
 
             prod = qa.get("product", "")
             if prod:
                 cr_rows.append(("feature", locus, "product_label", prod.strip()))
 
-    rows: List[Dict[str, Any]] = []
-    if merged:
-        for locus, base in merged.items():
-            iv = ivals.get(locus, {})
-            rows.append(
-                {
-                    "locus_tag": locus,
-                    "product": base.get("product", ""),
-                    "type": base.get("type", ""),
-                    "contig": iv.get("contig", ""),
-                    "start": iv.get("start", None),
-                    "end": iv.get("end", None),
-                    "strand": iv.get("strand", None),
-                }
-            )
+    # each merged row already carries its locus' interval
+    rows: List[Dict[str, Any]] = list(merged.values())
 
     features = _build_feature_meta(rows)
     feature_ids = [r.id for r in features]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 from typing import Optional, List
 from ...errors import ParseError
 from ...parse_obj import OmicData, FeatureRec, ColumnRec, CrossRef
@@ -17,6 +18,11 @@ DROP_COLS = {
 }
 REF_COLS = ["GEO", "SRX", "SRR", "Run", "BioSample", "BioProject"]
 
+ENT_RNA = IDS.type.rna
+ENT_SAMPLE = IDS.type.sample
+NS_LOCUS = IDS.ns.RefSeq_Locus
+NS_SAMPLE = IDS.ns.SampleID
+
 
 def _load_matrix(path: str) -> pd.DataFrame:
     try:
@@ -25,7 +31,11 @@ def _load_matrix(path: str) -> pd.DataFrame:
         raise ParseError(f"Failed to load matrix: {e}", path=path)
     df.index = df.index.astype(str)
     df.columns = df.columns.astype(str)
-    df = df.apply(pd.to_numeric, errors="coerce")
+    # the C reader has already typed the clean numeric columns; coerce only
+    # the ones holding stray text instead of re-building the whole matrix
+    text_cols = [c for c, dt in df.dtypes.items() if not is_numeric_dtype(dt)]
+    if text_cols:
+        df[text_cols] = df[text_cols].apply(pd.to_numeric, errors="coerce")
     if df.index.has_duplicates or df.columns.has_duplicates:
         raise ValueError("Duplicate feature or sample IDs in matrix")
     return df
@@ -33,13 +43,7 @@ def _load_matrix(path: str) -> pd.DataFrame:
 def _build_feature_meta(expr: pd.DataFrame) -> List[FeatureRec]:
     """Build one FeatureRec per locus_tag."""
     return [
-        FeatureRec(
-            id=str(fid),
-            entity=IDS.type.rna,
-            namespace=IDS.ns.RefSeq_Locus,
-            attrs={},
-        )
-        for fid in expr.index
+        FeatureRec(str(fid), ENT_RNA, NS_LOCUS, {}) for fid in expr.index.tolist()
     ]
 
 def _load_sample_metadata(path: str, sample_ids: List[str]) -> pd.DataFrame:
@@ -61,19 +65,22 @@ def _build_column_meta_and_xrefs(smeta: pd.DataFrame) -> tuple[List[ColumnRec],
     xref_fields = [c for c in smeta.columns if c in REF_COLS]
     meta_fields = [c for c in smeta.columns if c not in REF_COLS]
 
-    for sid, row in smeta.iterrows():
-        attrs = {k: to_primitive(v) for k, v in row.items() if pd.notna(v) and k in meta_fields}
+    # one object array per field group, NA as None, instead of a Series
+    # per row from iterrows
+    meta_vals = smeta[meta_fields].to_numpy(dtype=object, na_value=None)
+    xref_vals = smeta[xref_fields].to_numpy(dtype=object, na_value=None)
+    for sid, mrow, xrow in zip(smeta.index.tolist(), meta_vals, xref_vals):
+        attrs = {k: to_primitive(v) for k, v in zip(meta_fields, mrow) if v is not None}
         column_meta.append(
             ColumnRec(
                 id=str(sid),
-                entity=IDS.type.sample,
-                namespace=IDS.ns.SampleID,
+                entity=ENT_SAMPLE,
+                namespace=NS_SAMPLE,
                 attrs=attrs,
             )
         )
-        for ns in xref_fields:
-            val = row.get(ns)
-            if pd.notna(val) and str(val).strip():
+        for ns, val in zip(xref_fields, xrow):
+            if val is not None and str(val).strip():
                 xrefs.append(CrossRef(str(sid), ns, str(val).strip()))
     return column_meta, xrefs
 
@@ -110,8 +117,8 @@ def parse_precise2(
         column_meta = [
             ColumnRec(
                 id=str(cid),
-                entity=IDS.type.sample,
-                namespace=IDS.ns.SampleID,
+                entity=ENT_SAMPLE,
+                namespace=NS_SAMPLE,
             )
             for cid in expr.columns
         ]
@@ -3,8 +3,18 @@ import pandas as pd
 
 def to_primitive(x):
     """Convert numpy/pandas scalars to Python primitives."""
-    if pd.isna(x):
+    if x is None or x is pd.NA:
         return None
+    # exact-type checks: the common cells skip the pd.isna dispatch
+    # (np.float64 subclasses float, so it falls through to np.generic)
+    t = type(x)
+    if t is str or t is int or t is bool:
+        return x
+    if t is float:
+        return None if x != x else x
     if isinstance(x, (np.generic,)):  # catches np.int64, np.float64, np.bool_, etc.
-        return x.item()
-    return x
\ No newline at end of file
+        v = x.item()  # NaT comes back as None
+        return None if v is None or v != v else v
+    if pd.isna(x):
+        return None
+    return x
@@ -5,12 +5,19 @@ from pathlib import Path
 import warnings
 import pandas as pd
 
-sys.path.insert(0, "..")
-sys.path.insert(0, "../..")
+# the tests run from this directory; add the package roots once
+for _p in ("..", "../.."):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 from omics_io.parsers.reference.genbank import parse_genbank
 from omics_io.errors import ParseError
 
+try:
+    from Bio import BiopythonParserWarning
+except ImportError:  # older Biopython without a dedicated warning class
+    BiopythonParserWarning = None
+
 SEQ60 = "atgcatgcat" * 6
 SEQ80 = "atgcatgcat" * 8
 
@@ -106,18 +113,16 @@ class TestGenbank(unittest.TestCase):
     def setUpClass(cls):
         warnings.filterwarnings("ignore", category=UserWarning)
         warnings.filterwarnings("ignore", category=RuntimeWarning)
-        try:
-            from Bio import BiopythonParserWarning
-
+        if BiopythonParserWarning is not None:
             warnings.filterwarnings("ignore", category=BiopythonParserWarning)
-        except Exception:
-            pass
+        # one scratch directory for the class rather than one per test
+        td = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(td.cleanup)
+        cls.tmpdir = Path(td.name)
 
     def _write_tmp(self, text: str) -> str:
-        td = tempfile.TemporaryDirectory()
-        p = Path(td.name) / "tmp.gb"
+        p = self.tmpdir / f"{self._testMethodName}.gb"
         p.write_text(text)
-        self.addCleanup(td.cleanup)
         return str(p)
 
     def _feature_df(self, od) -> pd.DataFrame:
@@ -127,12 +132,23 @@ class TestGenbank(unittest.TestCase):
             return pd.DataFrame(columns=["entity", "namespace"]).set_index(
                 pd.Index([], name="id")
             )
-        rows = []
-        for r in recs:
-            row = {"id": r.id, "entity": r.entity, "namespace": r.namespace}
-            row.update(r.attrs or {})
-            rows.append(row)
-        return pd.DataFrame(rows).set_index("id").sort_index()
+        # build column lists directly; an attr missing from a record is NaN
+        ids, entities, namespaces = [], [], []
+        cols = {}
+        for i, r in enumerate(recs):
+            ids.append(r.id)
+            entities.append(r.entity)
+            namespaces.append(r.namespace)
+            for k, v in (r.attrs or {}).items():
+                col = cols.get(k)
+                if col is None:
+                    col = cols[k] = [float("nan")] * len(recs)
+                col[i] = v
+        # ids are unique, so lookups by label need no sorted index
+        return pd.DataFrame(
+            {"entity": entities, "namespace": namespaces, **cols},
+            index=pd.Index(ids, name="id"),
+        )
 
     def _assert_invariants(self, od):
         self.assertEqual(od.omics_type, "genomics")
@@ -178,8 +194,8 @@ class TestGenbank(unittest.TestCase):
             ("feature", "b0001", "UniProtKB", "P0AAA0"),
         }
         got = {(r.axis, r.src, r.namespace, r.target) for r in cr}
-        for w in want:
-            self.assertIn(w, got)
+        missing = want - got
+        self.assertFalse(missing, f"missing cross-refs: {missing}")
 
     def test_multiple_records_includes_all_feature_types(self):
         path = self._write_tmp(GB_MULTI)
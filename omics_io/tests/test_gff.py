@@ -5,8 +5,10 @@ from pathlib import Path
 import warnings
 import pandas as pd
 
-sys.path.insert(0, "..")
-sys.path.insert(0, "../..")
+# the tests run from this directory; add the package roots once
+for _p in ("..", "../.."):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 from omics_io.parsers.reference.gff3 import parse_gff3
 from omics_io.parse_obj import FeatureRec, CrossRef
@@ -34,14 +36,27 @@ class TestGFF3(unittest.TestCase):
     def setUpClass(cls):
         warnings.filterwarnings("ignore", category=UserWarning)
         warnings.filterwarnings("ignore", category=RuntimeWarning)
+        # one scratch directory for the class rather than one per test
+        td = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(td.cleanup)
+        cls.tmpdir = Path(td.name)
+        cls._parsed = {}
 
     def _write_tmp(self, text: str) -> str:
-        td = tempfile.TemporaryDirectory()
-        p = Path(td.name) / "tmp.gff"
+        p = self.tmpdir / f"{self._testMethodName}.gff"
         p.write_text(text)
-        self.addCleanup(td.cleanup)
         return str(p)
 
+    def _parse(self, text: str):
+        """``parse_gff3`` of ``text``, parsed once per fixture for the class.
+
+        Tests only read the result, so those sharing a fixture share it.
+        """
+        od = self._parsed.get(text)
+        if od is None:
+            od = self._parsed[text] = parse_gff3(self._write_tmp(text))
+        return od
+
     def _assert_invariants(self, od):
         self.assertEqual(od.omics_type, "genomics")
         self.assertIsInstance(od.matrix, pd.DataFrame)
@@ -60,8 +75,7 @@ class TestGFF3(unittest.TestCase):
                     self.assertIn(r.src, od.matrix.index)
 
     def test_single_record_merges_gene_and_cds(self):
-        path = self._write_tmp(GFF_SINGLE)
-        od = parse_gff3(path)
+        od = self._parse(GFF_SINGLE)
         self._assert_invariants(od)
 
         self.assertEqual(len(od.matrix), 1)
@@ -81,12 +95,19 @@ class TestGFF3(unittest.TestCase):
             ("feature", "b0001", "GeneID", "946000"),
             ("feature", "b0001", "UniProtKB", "P0AAA0"),
         }
-        for w in need:
-            self.assertIn(w, have)
+        missing = need - have
+        self.assertFalse(missing, f"missing cross-refs: {missing}")
+
+    def test_repeated_lines_do_not_duplicate_cross_refs(self):
+        od = self._parse(GFF_SINGLE)
+
+        trips = [(r.src, r.namespace, r.target) for r in od.cross_ref
+                 if r.namespace != "product_label"]
+        self.assertEqual(len(trips), len(set(trips)))
+        self.assertIn(("b0001", "gene", "gA"), trips)
 
     def test_multiple_records_includes_all_ftypes(self):
-        path = self._write_tmp(GFF_MULTI)
-        od = parse_gff3(path)
+        od = self._parse(GFF_MULTI)
         self._assert_invariants(od)
 
         fids = [r.id for r in od.feature_meta]
@@ -97,19 +118,11 @@ class TestGFF3(unittest.TestCase):
         self.assertTrue(types.issubset({"cds", "trna", "dna"}))
 
     def test_empty_file_yields_empty(self):
-        path = self._write_tmp(GFF_EMPTY)
-        od = parse_gff3(path)
+        od = self._parse(GFF_EMPTY)
         self._assert_invariants(od)
         self.assertEqual(len(od.matrix), 0)
         self.assertEqual(len(od.feature_meta), 0)
 
 
-    def test_empty_file_yields_empty(self):
-        path = self._write_tmp(GFF_EMPTY)
-        od = parse_gff3(path)
-        self._assert_invariants(od)
-
-        self.assertEqual(len(od.matrix), 0)
-
 if __name__ == "__main__":
     unittest.main()
@@ -1,40 +1,40 @@
 import gzip
 import sys
-import os
 import unittest
 import tempfile
 from pathlib import Path
 import pandas as pd
 
-sys.path.insert(0, "..")
-sys.path.insert(0, "../..")
+# the tests run from this directory; add the package roots once
+for _p in ("..", "../.."):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
 
 from omics_io.parsers.metabolomics.table import parse_metabolomics
 from omics_io.errors import ParseError
+from omics_io.parse_obj import CrossRef
 
 
 def write_tsv(df: pd.DataFrame, path: Path, sep="\t", index=False):
     df.to_csv(path, sep=sep, index=index)
 
 
-def write_tsv_gz(df: pd.DataFrame, path: Path, sep="\t", index=False):
-    with gzip.open(path, "wt", encoding="utf-8") as fh:
-        df.to_csv(fh, sep=sep, index=index)
-
-
-from dataclasses import asdict
-
-
 def cr_df(od):
-    return pd.DataFrame([asdict(r) for r in (od.cross_ref or [])])
+    # cross-refs are plain tuples; one columnar build, no per-record dicts
+    return pd.DataFrame(list(od.cross_ref or []), columns=list(CrossRef._fields))
 
 
 class TestIntensityTable(unittest.TestCase):
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp(prefix="metab_ut_"))
-
-        self.samples = ["ArcA_1", "ArcA_2", "WT_1", "WT_2"]
-        self.metabs = ["Alanine", "Arginine"]
+    @classmethod
+    def setUpClass(cls):
+        # one scratch directory for the class rather than one per test
+        td = tempfile.TemporaryDirectory(prefix="metab_ut_")
+        cls.addClassCleanup(td.cleanup)
+        cls.tmp = Path(td.name)
+
+        # the fixture frames are only read by the tests; build them once
+        cls.samples = ["ArcA_1", "ArcA_2", "WT_1", "WT_2"]
+        cls.metabs = ["Alanine", "Arginine"]
         rows = [
             [
                 "Factors",
@@ -45,13 +45,13 @@ class TestIntensityTable(unittest.TestCase):
                 "Genotype:Wildtype",
             ],
         ]
-        for m in self.metabs:
+        for m in cls.metabs:
             rows.append([m, m, 1.0, 2.0, 3.0, 4.0])
-        self.intensity_df = pd.DataFrame(
-            rows, columns=["Metabolite_name", "RefMet_name"] + self.samples, dtype=str
+        cls.intensity_df = pd.DataFrame(
+            rows, columns=["Metabolite_name", "RefMet_name"] + cls.samples, dtype=str
         )
 
-        self.map_df = pd.DataFrame(
+        cls.map_df = pd.DataFrame(
             {
                 "Metabolite_Name": ["Alanine", "Arginine"],
                 "RefMet_Name": ["Alanine", "Arginine"],
@@ -60,7 +60,7 @@ class TestIntensityTable(unittest.TestCase):
             }
         )
 
-        self.map_df_ci = self.map_df.rename(
+        cls.map_df_ci = cls.map_df.rename(
             columns={
                 "Metabolite_Name": "metabolite",
                 "RefMet_Name": "refmet",
@@ -69,22 +69,21 @@ class TestIntensityTable(unittest.TestCase):
             }
         )
 
-    def tearDown(self):
-        for p in self.tmp.glob("*"):
-            try:
-                p.unlink()
-            except Exception:
-                pass
-        try:
-            os.rmdir(self.tmp)
-        except Exception:
-            pass
+        # the shared frames serialised once; tests write the bytes directly
+        def tsv(df: pd.DataFrame) -> bytes:
+            return df.to_csv(sep="\t", index=False).encode("utf-8")
+
+        cls.intensity_tsv = tsv(cls.intensity_df)
+        cls.map_tsv = tsv(cls.map_df)
+        cls.map_ci_tsv = tsv(cls.map_df_ci)
+        cls.intensity_tsv_gz = gzip.compress(cls.intensity_tsv, compresslevel=1)
+        cls.map_tsv_gz = gzip.compress(cls.map_tsv, compresslevel=1)
 
     def test_basic_parse_with_mapping(self):
         p_int = self.tmp / "intensity.tsv"
         p_map = self.tmp / "map.tsv"
-        write_tsv(self.intensity_df, p_int, index=False)
-        write_tsv(self.map_df, p_map, index=False)
+        p_int.write_bytes(self.intensity_tsv)
+        p_map.write_bytes(self.map_tsv)
 
         od = parse_metabolomics(str(p_int), mapping_path=str(p_map))
         self.assertEqual(od.omics_type, "metabolomics")
@@ -101,15 +100,15 @@ class TestIntensityTable(unittest.TestCase):
         self.assertEqual(counts.get(("feature", "KEGG.Compound"), 0), 2)
         self.assertEqual(counts.get(("column", "Genotype"), 0), 4)
 
-        feat_ok = set(cr.query("axis == 'feature'")["src"]) <= set(od.matrix.index)
-        col_ok = set(cr.query("axis == 'column'")["src"]) <= set(od.matrix.columns)
+        feat_ok = set(cr.loc[cr["axis"] == "feature", "src"]) <= set(od.matrix.index)
+        col_ok = set(cr.loc[cr["axis"] == "column", "src"]) <= set(od.matrix.columns)
         self.assertTrue(feat_ok and col_ok)
 
     def test_case_insensitive_mapping_headers(self):
         p_int = self.tmp / "intensity.tsv"
         p_map = self.tmp / "map_ci.tsv"
-        write_tsv(self.intensity_df, p_int, index=False)
-        write_tsv(self.map_df_ci, p_map, index=False)
+        p_int.write_bytes(self.intensity_tsv)
+        p_map.write_bytes(self.map_ci_tsv)
 
         od = parse_metabolomics(str(p_int), mapping_path=str(p_map))
         cr = cr_df(od)
@@ -130,8 +129,8 @@ class TestIntensityTable(unittest.TestCase):
     def test_gzip_input(self):
         p_int = self.tmp / "intensity.tsv.gz"
         p_map = self.tmp / "map.tsv.gz"
-        write_tsv_gz(self.intensity_df, p_int, index=False)
-        write_tsv_gz(self.map_df, p_map, index=False)
+        p_int.write_bytes(self.intensity_tsv_gz)
+        p_map.write_bytes(self.map_tsv_gz)
 
         od = parse_metabolomics(str(p_int), mapping_path=str(p_map))
         cr = cr_df(od)
@@ -143,7 +142,7 @@ class TestIntensityTable(unittest.TestCase):
         p_int = self.tmp / "nofactors.tsv"
         p_map = self.tmp / "map.tsv"
         write_tsv(df, p_int, index=False)
-        write_tsv(self.map_df, p_map, index=False)
+        p_map.write_bytes(self.map_tsv)
 
         od = parse_metabolomics(str(p_int), mapping_path=str(p_map))
         cr = cr_df(od)
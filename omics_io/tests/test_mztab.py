@@ -1,15 +1,25 @@
 import io
+import os
 import sys
+import inspect
 import gzip
+import functools
 import unittest
 import tempfile
 from pathlib import Path
 import pandas as pd
 
-sys.path.insert(0, "..")
-sys.path.insert(0, "../..")
-
-from omics_io.parsers.proteomics.mztab import parse_mztab
+# the tests run from this directory; add the package roots once
+for _p in ("..", "../.."):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+from omics_io.parsers.proteomics.mztab import (
+    parse_mztab,
+    _open_mztab,
+    _normalize_protein_table,
+    _select_matrix,
+)
 from omics_io.errors import ParseError
 from omics_io.parse_obj import CrossRef
 
@@ -37,35 +47,69 @@ PRH\taccession\tdescription\tdatabase
 PRT\tsp|Q9XYZ1|TEST_ECOLI\tTest protein GN=tst\tuniprot
 """
 
+_ID_NULL_COVERAGE = """MTD\tmzTab-version\t1.0
+MTD\tmzTab-mode\tComplete
+MTD\tmzTab-type\tIdentification
+PRH\taccession\tdescription\tdatabase\tbest_search_engine_score[1]\tnum_psms\tnum_peptides_unique\tprotein_coverage
+PRT\tsp|P0A8V2|YBAX_ECOLI\tProtein YbaX GN=ybaX\tuniprot\t200.0\t2\t1\tnull
+PRT\tsp|P0A8W0|XXX_ECOLI\tProtein XXX GN=xxx\tuniprot\t150.0\t3\t1\tnull
+"""
+
+_QUANT_DECOYS_ONLY = """MTD\tmzTab-version\t1.0
+MTD\tmzTab-mode\tComplete
+MTD\tmzTab-type\tQuantification
+MTD\tassay[1]-name\tCondA_rep1
+PRH\taccession\tdescription\tdatabase\tabundance_assay[1]
+PRT\tDECOY_REV__XYZ\tDecoy protein\tuniprot\t10.0
+PRT\tCON__P00761\tTrypsin\tcontaminants\t20.0
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _utf8(text: str) -> bytes:
+    # the fixtures are module constants; encode each one once
+    return text.encode("utf-8")
+
 
 def _write(tmpdir: Path, name: str, text: str) -> str:
     p = tmpdir / name
-    p.write_text(text, encoding="utf-8")
+    p.write_bytes(_utf8(text))
     return str(p)
 
 
 def _write_gz(tmpdir: Path, name: str, text: str) -> str:
+    # one-shot compression; only the parser's gzip branch matters here
     p = tmpdir / name
-    with gzip.open(p, "wt", encoding="utf-8") as fh:
-        fh.write(text)
+    p.write_bytes(gzip.compress(_utf8(text), compresslevel=1))
     return str(p)
 
 
 class TestMzTabParser(unittest.TestCase):
-    def setUp(self):
-        self.tmpdir = Path(tempfile.mkdtemp(prefix="mztab_ut_"))
-
-    def tearDown(self):
-        try:
-            for f in self.tmpdir.glob("*"):
-                f.unlink(missing_ok=True)
-            self.tmpdir.rmdir()
-        except Exception:
-            pass
+    @classmethod
+    def setUpClass(cls):
+        # one scratch directory for the class rather than one per test
+        td = tempfile.TemporaryDirectory(prefix="mztab_ut_")
+        cls.addClassCleanup(td.cleanup)
+        cls.tmpdir = Path(td.name)
+        cls._parsed = {}
+
+    def _parse(self, name: str, text: str, **kw):
+        """``parse_mztab`` of ``text``, parsed once per fixture and options.
+
+        Options are resolved against the signature, so tests spelling out
+        the defaults share a result with those that omit them; tests only
+        read it.
+        """
+        bound = inspect.signature(parse_mztab).bind(name, **kw)
+        bound.apply_defaults()
+        key = (text, tuple(bound.kwargs.items()))
+        od = self._parsed.get(key)
+        if od is None:
+            od = self._parsed[key] = parse_mztab(_write(self.tmpdir, name, text), **kw)
+        return od
 
     def test_identification_basic_matrix_and_crossrefs(self):
-        path = _write(self.tmpdir, "id.mztab", _MIN_ID_MZTAB)
-        od = parse_mztab(path, prefer_quant=True)
+        od = self._parse("id.mztab", _MIN_ID_MZTAB, prefer_quant=True)
 
         self.assertEqual(od.omics_type, "proteomics")
 
@@ -76,8 +120,9 @@ class TestMzTabParser(unittest.TestCase):
         self.assertTrue(has_gene)
 
     def test_quant_abundance_matrix_and_decoy_filter(self):
-        path = _write(self.tmpdir, "quant.mztab", _MIN_QUANT_MZTAB)
-        od = parse_mztab(path, prefer_quant=True, filter_decoys=True)
+        od = self._parse(
+            "quant.mztab", _MIN_QUANT_MZTAB, prefer_quant=True, filter_decoys=True
+        )
 
         self.assertListEqual(sorted(od.matrix.columns.tolist()), ["assay_1", "assay_2"])
         self.assertEqual(od.matrix.shape[0], 1)
@@ -88,24 +133,41 @@ class TestMzTabParser(unittest.TestCase):
         self.assertIn("assay_2", od.matrix.columns)
 
     def test_numeric_matrix(self):
-        path = _write(self.tmpdir, "quant_nulls.mztab", _MIN_QUANT_MZTAB)
-        od = parse_mztab(path)
+        od = self._parse("quant_nulls.mztab", _MIN_QUANT_MZTAB)
 
         self.assertTrue(
             all(pd.api.types.is_numeric_dtype(dt) for dt in od.matrix.dtypes)
         )
 
     def test_evidence_thresholds_filter(self):
-        path = _write(self.tmpdir, "id_thresh.mztab", _MIN_ID_MZTAB)
-        od = parse_mztab(path, min_psms=10, min_unique=10)
+        od = self._parse("id_thresh.mztab", _MIN_ID_MZTAB, min_psms=10, min_unique=10)
         self.assertEqual(od.matrix.shape[0], 0)
 
         self.assertTrue(od.cross_ref == [] or od.cross_ref is None)
 
+    def _filtered_matrix(self, name: str, text: str, **kw) -> pd.DataFrame:
+        """The matrix ``parse_mztab`` hands to ``OmicData`` for ``text``."""
+        t = _open_mztab(_write(self.tmpdir, name, text))
+        ptab = _normalize_protein_table(t.protein_table, **kw)
+        return _select_matrix(ptab, mztab_type=str(t.metadata.get("mzTab-type", "")))
+
+    def test_thresholds_removing_every_row_leave_numeric_matrix(self):
+        m = self._filtered_matrix("id_null_cov.mztab", _ID_NULL_COVERAGE, min_psms=5)
+        self.assertEqual(m.shape[0], 0)
+        self.assertIn("protein_coverage", m.columns)
+        self.assertTrue(all(pd.api.types.is_numeric_dtype(dt) for dt in m.dtypes))
+
+    def test_decoy_only_quant_leaves_numeric_matrix(self):
+        m = self._filtered_matrix("decoys.mztab", _QUANT_DECOYS_ONLY)
+        self.assertEqual(m.shape[0], 0)
+        self.assertGreater(m.shape[1], 0)
+        self.assertTrue(all(pd.api.types.is_numeric_dtype(dt) for dt in m.dtypes))
+
+    # parses a full PRIDE export; opt in with OMICS_IO_SLOW=1
+    @unittest.skipUnless(os.environ.get("OMICS_IO_SLOW"), "slow integration test")
     def test_sample(self):
         prot1 = parse_mztab(Path("data/F020490.pride.mztab"))
-        for e in prot1.column_meta:
-            print(e)
+        self.assertGreater(len(prot1.column_meta), 0)
 
 
 if __name__ == "__main__":